@@ -26,7 +26,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import our modules
-from src.core.bridge import MiktosAIBridge
+from src.core.bridge import MiktosAIBridge, install_uvloop
 from src.core.models import AICommand
 from src.connectors.blender_connector import BlenderConnector
 from src.comfyui.client import ComfyUIClient
@@ -351,7 +351,7 @@ class IntegrationTester:
                     start_time=datetime.now(),
                     workflow_data={"test": True}
                 )
-                self.ai_bridge.active_workflows[test_workflow_id] = execution
+                self.ai_bridge.active_workflows[test_workflow_id] = execution.to_dict()
                 
                 # Simulate progress update
                 self.ai_bridge._update_workflow_progress(test_workflow_id, 0.5)
@@ -489,4 +489,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
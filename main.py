@@ -688,5 +688,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="auto" if settings.use_uvloop else "asyncio"
     )
\ No newline at end of file
@@ -6,14 +6,166 @@ This script helps set up the complete development environment for Miktos,
 including all dependencies, configurations, and initial setup.
 """
 
+import argparse
+import asyncio
+import logging
 import subprocess
 import sys
 import os
-import json
-import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import BufferingHandler
 from pathlib import Path
 import platform
-import urllib.request
+
+
+# Blender addon sources written by setup_blender_addon
+_ADDON_INIT: bytes = b'''
+bl_info = {
+    "name": "Miktos Bridge",
+    "author": "Miktos Universe", 
+    "version": (1, 0, 0),
+    "blender": (3, 0, 0),
+    "location": "View3D > Sidebar > Miktos",
+    "description": "Bridge between Blender and Miktos AI Platform",
+    "category": "3D View",
+}
+
+import bpy
+from . import miktos_panel
+from . import miktos_operators
+
+def register():
+    miktos_panel.register()
+    miktos_operators.register()
+
+def unregister():
+    miktos_panel.unregister()
+    miktos_operators.unregister()
+
+if __name__ == "__main__":
+    register()
+'''
+
+_PANEL_CONTENT: bytes = b'''
+import bpy
+
+class MIKTOS_PT_main_panel(bpy.types.Panel):
+    bl_label = "Miktos AI"
+    bl_idname = "MIKTOS_PT_main_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Miktos"
+
+    def draw(self, context):
+        layout = self.layout
+        
+        # Connection status
+        layout.label(text="AI Bridge Connection:")
+        layout.operator("miktos.connect_bridge")
+        
+        # Texture generation
+        layout.separator()
+        layout.label(text="Texture Generation:")
+        layout.prop(context.scene, "miktos_prompt")
+        layout.operator("miktos.generate_texture")
+
+def register():
+    bpy.utils.register_class(MIKTOS_PT_main_panel)
+    bpy.types.Scene.miktos_prompt = bpy.props.StringProperty(
+        name="Prompt",
+        description="AI texture generation prompt",
+        default="brick wall texture"
+    )
+
+def unregister():
+    bpy.utils.unregister_class(MIKTOS_PT_main_panel)
+    del bpy.types.Scene.miktos_prompt
+'''
+
+_OPERATORS_CONTENT: bytes = b'''
+import bpy
+import requests
+
+class MIKTOS_OT_connect_bridge(bpy.types.Operator):
+    bl_idname = "miktos.connect_bridge"
+    bl_label = "Connect to AI Bridge"
+    bl_description = "Connect to Miktos AI Bridge"
+
+    def execute(self, context):
+        try:
+            response = requests.get("http://localhost:8000/health", timeout=5)
+            if response.status_code == 200:
+                self.report({'INFO'}, "Connected to AI Bridge")
+            else:
+                self.report({'ERROR'}, "AI Bridge not responding")
+        except Exception as e:
+            self.report({'ERROR'}, f"Connection failed: {str(e)}")
+        
+        return {'FINISHED'}
+
+class MIKTOS_OT_generate_texture(bpy.types.Operator):
+    bl_idname = "miktos.generate_texture"
+    bl_label = "Generate Texture"
+    bl_description = "Generate AI texture for selected object"
+
+    def execute(self, context):
+        prompt = context.scene.miktos_prompt
+        
+        if not prompt:
+            self.report({'ERROR'}, "Please enter a prompt")
+            return {'CANCELLED'}
+        
+        try:
+            # Send texture generation request
+            data = {
+                "command": "generate_texture",
+                "parameters": {
+                    "prompt": prompt,
+                    "size": [1024, 1024],
+                    "maps": ["diffuse"]
+                }
+            }
+            
+            response = requests.post(
+                "http://localhost:8000/api/v1/execute-command",
+                json=data,
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                if result.get("success"):
+                    self.report({'INFO'}, "Texture generation started")
+                else:
+                    self.report({'ERROR'}, f"Generation failed: {result.get('message')}")
+            else:
+                self.report({'ERROR'}, "AI Bridge request failed")
+                
+        except Exception as e:
+            self.report({'ERROR'}, f"Request failed: {str(e)}")
+        
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(MIKTOS_OT_connect_bridge)
+    bpy.utils.register_class(MIKTOS_OT_generate_texture)
+
+def unregister():
+    bpy.utils.unregister_class(MIKTOS_OT_connect_bridge)
+    bpy.utils.unregister_class(MIKTOS_OT_generate_texture)
+'''
+
+
+class _AuditHandler(BufferingHandler):
+    """In-memory audit trail keeping the most recent records; flushing never discards them"""
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.buffer = deque(maxlen=capacity)
+    
+    def flush(self):
+        pass
 
 
 class MiktosSetup:
@@ -22,101 +174,137 @@ class MiktosSetup:
     def __init__(self):
         self.system = platform.system()
         self.project_root = Path(__file__).parent
-        self.setup_log = []
         
-    def log(self, message: str, level: str = "INFO"):
-        """Log setup messages"""
-        log_entry = f"[{level}] {message}"
-        self.setup_log.append(log_entry)
-        print(log_entry)
+        # Console output plus an in-memory audit trail of every record
+        self._logger = logging.getLogger("miktos.setup")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            console = logging.StreamHandler(sys.stdout)
+            console.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+            self._logger.addHandler(console)
+        # One audit trail per logger, shared by every MiktosSetup in the process
+        self._audit = next((h for h in self._logger.handlers if isinstance(h, _AuditHandler)), None)
+        if self._audit is None:
+            self._audit = _AuditHandler(capacity=10000)
+            self._logger.addHandler(self._audit)
+        
+        # Virtual environment executables, resolved once
+        self.venv_path = self.project_root / "venv"
+        if self.system == "Windows":
+            self.venv_bin = self.venv_path / "Scripts"
+            self.python_cmd = str(self.venv_bin / "python.exe")
+        else:
+            self.venv_bin = self.venv_path / "bin"
+            self.python_cmd = str(self.venv_bin / "python")
+        self.pip_cmd = str(self.venv_bin / "pip")
+        
+    @property
+    def setup_log(self) -> list:
+        """Formatted setup log entries, built on demand"""
+        return [f"[{r.levelname}] {r.getMessage()}" for r in self._audit.buffer]
     
-    def run_command(self, command: str, cwd: Path = None) -> bool:
-        """Run shell command and return success status"""
+    def run_command(self, command: str, cwd: Path = None, inherit_stdio: bool = False, env: dict = None) -> bool:
+        """Run shell command and return success status
+        
+        With inherit_stdio the child writes straight to our terminal instead
+        of having its output captured and buffered in memory.
+        """
         try:
             cwd = cwd or self.project_root
-            self.log(f"Running: {command}")
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                capture_output=True,
-                text=True
-            )
+            self._logger.info("Running: %s", command)
+            if inherit_stdio:
+                result = subprocess.run(command, shell=True, cwd=cwd, env=env)
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    cwd=cwd,
+                    env=env,
+                    capture_output=True,
+                    text=True
+                )
             
             if result.returncode == 0:
-                self.log(f"✅ Command successful")
+                self._logger.info("✅ Command successful")
                 return True
+            elif inherit_stdio:
+                self._logger.error("❌ Command failed with exit code %s", result.returncode)
+                return False
             else:
-                self.log(f"❌ Command failed: {result.stderr}", "ERROR")
+                self._logger.error("❌ Command failed: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            self.log(f"❌ Command error: {str(e)}", "ERROR")
+            self._logger.error("❌ Command error: %s", e)
             return False
     
     def check_python_version(self) -> bool:
         """Check Python version compatibility"""
-        self.log("Checking Python version...")
+        self._logger.info("Checking Python version...")
         
         version = sys.version_info
         if version.major == 3 and version.minor >= 11:
-            self.log(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
+            self._logger.info("✅ Python %s.%s.%s is compatible", version.major, version.minor, version.micro)
             return True
         else:
-            self.log(f"❌ Python {version.major}.{version.minor}.{version.micro} is not compatible. Need Python 3.11+", "ERROR")
+            self._logger.error("❌ Python %s.%s.%s is not compatible. Need Python 3.11+", version.major, version.minor, version.micro)
             return False
     
-    def setup_virtual_environment(self) -> bool:
+    def setup_virtual_environment(self, upgrade_deps: bool = False) -> bool:
         """Set up Python virtual environment"""
-        self.log("Setting up virtual environment...")
+        self._logger.info("Setting up virtual environment...")
         
-        venv_path = self.project_root / "venv"
-        
-        if venv_path.exists():
-            self.log("Virtual environment already exists")
+        # A bare venv directory without an interpreter is stale; recreate it
+        if Path(self.python_cmd).exists():
+            self._logger.info("Virtual environment already exists")
             return True
         
-        # Create virtual environment
-        if self.run_command(f"python -m venv {venv_path}"):
-            self.log("✅ Virtual environment created")
+        # Create virtual environment (--upgrade-deps only on request, it
+        # re-downloads pip/setuptools on every cold run)
+        venv_args = "--upgrade-deps " if upgrade_deps else ""
+        if self.run_command(f"python -m venv {venv_args}{self.venv_path}"):
+            self._logger.info("✅ Virtual environment created")
             return True
         else:
-            self.log("❌ Failed to create virtual environment", "ERROR")
+            self._logger.error("❌ Failed to create virtual environment")
             return False
     
     def install_python_dependencies(self) -> bool:
         """Install Python dependencies"""
-        self.log("Installing Python dependencies...")
-        
-        # Determine pip command based on OS
-        venv_path = self.project_root / "venv"
-        if self.system == "Windows":
-            pip_cmd = str(venv_path / "Scripts" / "pip")
-        else:
-            pip_cmd = str(venv_path / "bin" / "pip")
+        self._logger.info("Installing Python dependencies...")
         
         # Install requirements
         requirements_file = self.project_root / "requirements.txt"
         if requirements_file.exists():
-            if self.run_command(f"{pip_cmd} install -r {requirements_file}"):
-                self.log("✅ Python dependencies installed")
+            # Build native wheels with all cores and fetch metadata lazily
+            env = {
+                **os.environ,
+                "MAKEFLAGS": f"-j{os.cpu_count() or 1}",
+                "PIP_USE_FEATURE": "fast-deps",
+            }
+            if self.run_command(
+                f"{self.pip_cmd} install --prefer-binary --no-compile -r {requirements_file}",
+                env=env
+            ):
+                self._logger.info("✅ Python dependencies installed")
                 return True
             else:
-                self.log("❌ Failed to install Python dependencies", "ERROR")
+                self._logger.error("❌ Failed to install Python dependencies")
                 return False
         else:
-            self.log("❌ requirements.txt not found", "ERROR")
+            self._logger.error("❌ requirements.txt not found")
             return False
     
     def setup_environment_file(self) -> bool:
         """Set up environment configuration file"""
-        self.log("Setting up environment configuration...")
+        self._logger.info("Setting up environment configuration...")
         
         env_file = self.project_root / ".env"
         env_example = self.project_root / ".env.example"
         
         if env_file.exists():
-            self.log("Environment file already exists")
+            self._logger.info("Environment file already exists")
             return True
         
         # Create .env from example or default
@@ -162,15 +350,15 @@ MODEL_OUTPUT_DIR=./output/models
         try:
             with open(env_file, 'w') as f:
                 f.write(env_content)
-            self.log("✅ Environment file created")
+            self._logger.info("✅ Environment file created")
             return True
         except Exception as e:
-            self.log(f"❌ Failed to create environment file: {str(e)}", "ERROR")
+            self._logger.error("❌ Failed to create environment file: %s", e)
             return False
     
     def create_directories(self) -> bool:
         """Create necessary directories"""
-        self.log("Creating project directories...")
+        self._logger.info("Creating project directories...")
         
         directories = [
             "output",
@@ -187,17 +375,29 @@ MODEL_OUTPUT_DIR=./output/models
             for dir_name in directories:
                 dir_path = self.project_root / dir_name
                 dir_path.mkdir(parents=True, exist_ok=True)
-                self.log(f"Created directory: {dir_name}")
+                self._logger.info("Created directory: %s", dir_name)
             
-            self.log("✅ All directories created")
+            self._logger.info("✅ All directories created")
             return True
         except Exception as e:
-            self.log(f"❌ Failed to create directories: {str(e)}", "ERROR")
+            self._logger.error("❌ Failed to create directories: %s", e)
             return False
     
-    def check_external_dependencies(self) -> dict:
+    async def _probe_dependency(self, command: str) -> subprocess.CompletedProcess:
+        """Run a version probe without blocking the event loop"""
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        return subprocess.CompletedProcess(
+            command, proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+        )
+    
+    async def check_external_dependencies(self) -> dict:
         """Check for external dependencies"""
-        self.log("Checking external dependencies...")
+        self._logger.info("Checking external dependencies...")
         
         dependencies = {
             "node": {"command": "node --version", "required": False},
@@ -207,220 +407,78 @@ MODEL_OUTPUT_DIR=./output/models
             "git": {"command": "git --version", "required": True}
         }
         
+        # Probe all tools concurrently
+        probes = await asyncio.gather(
+            *(self._probe_dependency(info["command"]) for info in dependencies.values()),
+            return_exceptions=True
+        )
+        
         results = {}
         
-        for dep, info in dependencies.items():
-            try:
-                result = subprocess.run(
-                    info["command"],
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    version = result.stdout.strip().split('\n')[0]
-                    results[dep] = {"available": True, "version": version}
-                    self.log(f"✅ {dep}: {version}")
-                else:
-                    results[dep] = {"available": False, "version": None}
-                    level = "ERROR" if info["required"] else "WARN"
-                    self.log(f"❌ {dep}: Not available", level)
+        for (dep, info), result in zip(dependencies.items(), probes):
+            level = logging.ERROR if info["required"] else logging.WARNING
             
-            except Exception as e:
-                results[dep] = {"available": False, "version": None, "error": str(e)}
-                level = "ERROR" if info["required"] else "WARN"
-                self.log(f"❌ {dep}: Error checking - {str(e)}", level)
+            if isinstance(result, Exception):
+                results[dep] = {"available": False, "version": None, "error": str(result)}
+                self._logger.log(level, "❌ %s: Error checking - %s", dep, result)
+            elif result.returncode == 0:
+                version = result.stdout.strip().split('\n')[0]
+                results[dep] = {"available": True, "version": version}
+                self._logger.info("✅ %s: %s", dep, version)
+            else:
+                results[dep] = {"available": False, "version": None}
+                self._logger.log(level, "❌ %s: Not available", dep)
         
         return results
     
     def setup_blender_addon(self) -> bool:
         """Set up basic Blender addon"""
-        self.log("Setting up Blender addon...")
+        self._logger.info("Setting up Blender addon...")
         
         addon_dir = self.project_root / "blender_addon"
         addon_file = addon_dir / "__init__.py"
         
         if addon_file.exists():
-            self.log("Blender addon already exists")
+            self._logger.info("Blender addon already exists")
             return True
         
-        # Create basic addon structure
-        addon_init_content = '''
-bl_info = {
-    "name": "Miktos Bridge",
-    "author": "Miktos Universe", 
-    "version": (1, 0, 0),
-    "blender": (3, 0, 0),
-    "location": "View3D > Sidebar > Miktos",
-    "description": "Bridge between Blender and Miktos AI Platform",
-    "category": "3D View",
-}
-
-import bpy
-from . import miktos_panel
-from . import miktos_operators
-
-def register():
-    miktos_panel.register()
-    miktos_operators.register()
-
-def unregister():
-    miktos_panel.unregister()
-    miktos_operators.unregister()
-
-if __name__ == "__main__":
-    register()
-'''
-        
         try:
-            with open(addon_file, 'w') as f:
-                f.write(addon_init_content)
+            addon_file.write_bytes(_ADDON_INIT)
             
             # Create additional addon files
             self._create_addon_files(addon_dir)
             
-            self.log("✅ Blender addon structure created")
+            self._logger.info("✅ Blender addon structure created")
             return True
         except Exception as e:
-            self.log(f"❌ Failed to create Blender addon: {str(e)}", "ERROR")
+            self._logger.error("❌ Failed to create Blender addon: %s", e)
             return False
     
     def _create_addon_files(self, addon_dir: Path):
         """Create additional Blender addon files"""
+        addon_files = [
+            (addon_dir / "miktos_panel.py", _PANEL_CONTENT),
+            (addon_dir / "miktos_operators.py", _OPERATORS_CONTENT),
+        ]
         
-        # Panel file
-        panel_content = '''
-import bpy
-
-class MIKTOS_PT_main_panel(bpy.types.Panel):
-    bl_label = "Miktos AI"
-    bl_idname = "MIKTOS_PT_main_panel"
-    bl_space_type = 'VIEW_3D'
-    bl_region_type = 'UI'
-    bl_category = "Miktos"
-
-    def draw(self, context):
-        layout = self.layout
-        
-        # Connection status
-        layout.label(text="AI Bridge Connection:")
-        layout.operator("miktos.connect_bridge")
-        
-        # Texture generation
-        layout.separator()
-        layout.label(text="Texture Generation:")
-        layout.prop(context.scene, "miktos_prompt")
-        layout.operator("miktos.generate_texture")
-
-def register():
-    bpy.utils.register_class(MIKTOS_PT_main_panel)
-    bpy.types.Scene.miktos_prompt = bpy.props.StringProperty(
-        name="Prompt",
-        description="AI texture generation prompt",
-        default="brick wall texture"
-    )
-
-def unregister():
-    bpy.utils.unregister_class(MIKTOS_PT_main_panel)
-    del bpy.types.Scene.miktos_prompt
-'''
-        
-        operators_content = '''
-import bpy
-import requests
-import json
-
-class MIKTOS_OT_connect_bridge(bpy.types.Operator):
-    bl_idname = "miktos.connect_bridge"
-    bl_label = "Connect to AI Bridge"
-    bl_description = "Connect to Miktos AI Bridge"
-
-    def execute(self, context):
-        try:
-            response = requests.get("http://localhost:8000/health", timeout=5)
-            if response.status_code == 200:
-                self.report({'INFO'}, "Connected to AI Bridge")
-            else:
-                self.report({'ERROR'}, "AI Bridge not responding")
-        except Exception as e:
-            self.report({'ERROR'}, f"Connection failed: {str(e)}")
-        
-        return {'FINISHED'}
-
-class MIKTOS_OT_generate_texture(bpy.types.Operator):
-    bl_idname = "miktos.generate_texture"
-    bl_label = "Generate Texture"
-    bl_description = "Generate AI texture for selected object"
-
-    def execute(self, context):
-        prompt = context.scene.miktos_prompt
-        
-        if not prompt:
-            self.report({'ERROR'}, "Please enter a prompt")
-            return {'CANCELLED'}
-        
-        try:
-            # Send texture generation request
-            data = {
-                "command": "generate_texture",
-                "parameters": {
-                    "prompt": prompt,
-                    "size": [1024, 1024],
-                    "maps": ["diffuse"]
-                }
-            }
-            
-            response = requests.post(
-                "http://localhost:8000/api/v1/execute-command",
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("success"):
-                    self.report({'INFO'}, "Texture generation started")
-                else:
-                    self.report({'ERROR'}, f"Generation failed: {result.get('message')}")
-            else:
-                self.report({'ERROR'}, "AI Bridge request failed")
-                
-        except Exception as e:
-            self.report({'ERROR'}, f"Request failed: {str(e)}")
-        
-        return {'FINISHED'}
-
-def register():
-    bpy.utils.register_class(MIKTOS_OT_connect_bridge)
-    bpy.utils.register_class(MIKTOS_OT_generate_texture)
-
-def unregister():
-    bpy.utils.unregister_class(MIKTOS_OT_connect_bridge)
-    bpy.utils.unregister_class(MIKTOS_OT_generate_texture)
-'''
-        
-        # Write files
-        with open(addon_dir / "miktos_panel.py", 'w') as f:
-            f.write(panel_content)
-        
-        with open(addon_dir / "miktos_operators.py", 'w') as f:
-            f.write(operators_content)
+        # The writes are independent; issue them in parallel
+        with ThreadPoolExecutor(max_workers=len(addon_files)) as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), addon_files))
     
     def run_integration_test(self) -> bool:
         """Run integration test"""
-        self.log("Running integration test...")
+        self._logger.info("Running integration test...")
         
         test_script = self.project_root / "integration_test.py"
         if test_script.exists():
-            if self.run_command(f"python {test_script}"):
-                self.log("✅ Integration test completed")
+            if self.run_command(f"python {test_script}", inherit_stdio=True):
+                self._logger.info("✅ Integration test completed")
                 return True
             else:
-                self.log("❌ Integration test failed", "ERROR")
+                self._logger.error("❌ Integration test failed")
                 return False
         else:
-            self.log("❌ Integration test script not found", "ERROR")
+            self._logger.error("❌ Integration test script not found")
             return False
     
     def generate_setup_report(self, dependency_results: dict):
@@ -479,7 +537,7 @@ def unregister():
         
         print("\n" + "=" * 60)
     
-    def run_setup(self):
+    async def run_setup(self, upgrade_deps: bool = False):
         """Run complete setup process"""
         print("🚀 Miktos Platform - Development Setup")
         print("=" * 40)
@@ -489,9 +547,13 @@ def unregister():
             print("❌ Setup failed: Incompatible Python version")
             return False
         
+        # External dependency probes don't depend on the setup steps, so
+        # run them in the background while the steps execute
+        dep_task = asyncio.create_task(self.check_external_dependencies())
+        
         # Setup steps
         steps = [
-            ("Virtual Environment", self.setup_virtual_environment),
+            ("Virtual Environment", lambda: self.setup_virtual_environment(upgrade_deps=upgrade_deps)),
             ("Python Dependencies", self.install_python_dependencies),
             ("Environment Configuration", self.setup_environment_file),
             ("Project Directories", self.create_directories),
@@ -499,13 +561,15 @@ def unregister():
         ]
         
         for step_name, step_func in steps:
-            self.log(f"\n📦 {step_name}")
-            if not step_func():
+            self._logger.info("\n📦 %s", step_name)
+            # Steps are blocking; run them off the loop so the probes progress
+            if not await asyncio.to_thread(step_func):
                 print(f"❌ Setup failed at: {step_name}")
+                dep_task.cancel()
                 return False
         
         # Check external dependencies
-        dependency_results = self.check_external_dependencies()
+        dependency_results = await dep_task
         
         # Generate report
         self.generate_setup_report(dependency_results)
@@ -515,8 +579,16 @@ def unregister():
 
 def main():
     """Main setup execution"""
+    parser = argparse.ArgumentParser(description="Set up the Miktos development environment")
+    parser.add_argument(
+        "--upgrade-deps",
+        action="store_true",
+        help="upgrade pip and setuptools when creating the virtual environment"
+    )
+    args = parser.parse_args()
+    
     setup = MiktosSetup()
-    success = setup.run_setup()
+    success = asyncio.run(setup.run_setup(upgrade_deps=args.upgrade_deps))
     
     if success:
         print("\n🎉 Setup completed successfully!")
@@ -4,12 +4,19 @@ For testing and development without external ComfyUI server
 """
 import asyncio
 import logging
+import os
 import json
 import uuid
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from datetime import datetime
 import time
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class StandaloneComfyUIExecutor:
@@ -21,6 +28,8 @@ class StandaloneComfyUIExecutor:
     def __init__(self, output_dir: str = "./output"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Simulated processing time in seconds (0 skips the sleep entirely)
+        self.sim_delay = float(os.environ.get("MIKTOS_STANDALONE_DELAY", "0.0"))
         
     async def check_connection(self) -> bool:
         """Always returns True for standalone mode"""
@@ -40,16 +49,23 @@ class StandaloneComfyUIExecutor:
             logger.info(f"[STANDALONE] Simulating workflow execution: {prompt_id}")
             
             # Simulate processing time
-            await asyncio.sleep(2)
+            if self.sim_delay:
+                await asyncio.sleep(self.sim_delay)
             
             # Create mock output file
             output_file = self.output_dir / f"mock_texture_{prompt_id[:8]}.png"
             
-            # Create a simple text file as mock output
-            with open(output_file.with_suffix('.txt'), 'w') as f:
-                f.write(f"Mock ComfyUI output for workflow: {prompt_id}\n")
-                f.write(f"Workflow: {json.dumps(workflow, indent=2)}\n")
-                f.write(f"Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            # Dump the workflow next to the mock output only when debugging;
+            # nothing else reads this file
+            if logger.isEnabledFor(logging.DEBUG):
+                if orjson is not None:
+                    workflow_json = orjson.dumps(workflow).decode()
+                else:
+                    workflow_json = json.dumps(workflow, separators=(',', ':'))
+                with open(output_file.with_suffix('.txt'), 'w') as f:
+                    f.write(f"Mock ComfyUI output for workflow: {prompt_id}\n")
+                    f.write(f"Workflow: {workflow_json}\n")
+                    f.write(f"Generated at: {datetime.now().isoformat(sep=' ', timespec='seconds')}\n")
             
             logger.info(f"[STANDALONE] Workflow completed: {output_file}")
             return prompt_id
@@ -65,10 +81,6 @@ class StandaloneComfyUIExecutor:
             "queue_pending": []
         }
     
-    async def check_connection(self) -> bool:
-        """Always return True for standalone mode"""
-        return True
-    
     async def get_available_models(self) -> List[str]:
         """Return mock available models"""
         return [
@@ -91,7 +103,8 @@ class StandaloneComfyUIExecutor:
             logger.info(f"[STANDALONE] Simple generation: {prompt}")
             
             # Simulate processing
-            await asyncio.sleep(1.5)
+            if self.sim_delay:
+                await asyncio.sleep(self.sim_delay)
             
             # Create mock result
             result = {
@@ -104,8 +117,8 @@ class StandaloneComfyUIExecutor:
                     "width": width,
                     "height": height
                 },
-                "output_files": [f"mock_texture_{int(time.time())}.png"],
-                "execution_time": 1.5
+                "output_files": [f"mock_texture_{time.time_ns() // 1_000_000_000}.png"],
+                "execution_time": self.sim_delay
             }
             
             logger.info(f"[STANDALONE] Simple generation completed")
@@ -0,0 +1,216 @@
+
+import bpy
+import bmesh
+import json
+import asyncio
+import websockets
+from websockets.server import serve
+import threading
+
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    import msgspec
+    _MSGPACK_ENC = msgspec.msgpack.Encoder()
+    # Raw buffers (ext type 0x10) arrive as plain bytes
+    _MSGPACK_DEC = msgspec.msgpack.Decoder(
+        ext_hook=lambda code, data: bytes(data) if code == 0x10 else msgspec.msgpack.Ext(code, bytes(data))
+    )
+except ImportError:
+    # Without msgspec the bridge only speaks JSON
+    msgspec = None
+
+# Principled BSDF input fed by each texture map type; only diffuse holds colour
+_MAP_INPUTS = {
+    "diffuse": "Base Color",
+    "normal": "Normal",
+    "roughness": "Roughness",
+    "metallic": "Metallic",
+    "height": None,
+    "ambient_occlusion": None
+}
+
+
+def _get_node(nodes, name, node_type):
+    """Return the named node, creating it on first use"""
+    node = nodes.get(name)
+    if node is None:
+        node = nodes.new(type=node_type)
+        node.name = name
+    return node
+
+class MiktosBridge:
+    def __init__(self):
+        self.server = None
+        self.port = 9999
+        
+    async def handle_command(self, websocket, path):
+        """Handle incoming commands from Miktos AI Bridge"""
+        async for message in websocket:
+            # Binary frames carry MessagePack, text frames JSON; reply in kind
+            binary = isinstance(message, bytes) and msgspec is not None
+            try:
+                payload = _MSGPACK_DEC.decode(message) if binary else _json_loads(message)
+            except Exception as e:
+                # Nothing to echo a msg_id from; the bridge discards this
+                response = {
+                    "status": "error",
+                    "error": f"Invalid message: {e}"
+                }
+            else:
+                # A list is a batch of commands, answered with a list of responses
+                if isinstance(payload, list):
+                    response = [await self.respond(command) for command in payload]
+                else:
+                    response = await self.respond(payload)
+            await websocket.send(_MSGPACK_ENC.encode(response) if binary else _json_dumps(response))
+    
+    async def respond(self, command):
+        """Process one command, echoing its msg_id so the bridge can match it"""
+        try:
+            response = await self.process_command(command)
+        except Exception as e:
+            response = {"status": "error", "error": str(e)}
+        
+        if isinstance(command, dict) and "msg_id" in command:
+            response = dict(response, msg_id=command["msg_id"])
+        return response
+    
+    async def process_command(self, command):
+        """Process commands from AI Bridge"""
+        cmd_type = command.get("command")
+        data = command.get("data", {})
+        
+        if cmd_type == "hello":
+            # Codec negotiation: accept MessagePack only if msgspec is available
+            codec = "msgpack" if msgspec is not None and command.get("codec") == "msgpack" else "json"
+            return {"status": "success", "codec": codec}
+        
+        elif cmd_type == "ping":
+            return {"status": "success", "message": "pong"}
+        
+        elif cmd_type == "get_scene_info":
+            return self.get_scene_info()
+        
+        elif cmd_type == "apply_texture":
+            return self.apply_texture(data)
+        
+        elif cmd_type == "create_primitive":
+            return self.create_primitive(data)
+        
+        else:
+            return {"status": "error", "error": f"Unknown command: {cmd_type}"}
+    
+    def get_scene_info(self):
+        """Get current scene information"""
+        scene = bpy.context.scene
+        objects = [obj.name for obj in scene.objects]
+        
+        return {
+            "status": "success",
+            "data": {
+                "scene_name": scene.name,
+                "objects": objects,
+                "frame_current": scene.frame_current,
+                "frame_start": scene.frame_start,
+                "frame_end": scene.frame_end
+            }
+        }
+    
+    def apply_texture(self, data):
+        """Apply one texture map to the object's shared material"""
+        try:
+            object_name = data.get("object_name")
+            texture_path = data.get("texture_path")
+            texture_type = data.get("texture_type", "diffuse")
+            material_name = data.get("material_name") or f"{object_name}_material"
+            
+            if texture_type not in _MAP_INPUTS:
+                return {"status": "error", "error": f"Unknown texture type: {texture_type}"}
+            
+            # Get object
+            obj = bpy.data.objects.get(object_name)
+            if not obj:
+                return {"status": "error", "error": f"Object {object_name} not found"}
+            
+            # Every map of a set goes into the same material
+            material = bpy.data.materials.get(material_name)
+            if material is None:
+                material = bpy.data.materials.new(name=material_name)
+                material.use_nodes = True
+                material.node_tree.nodes.clear()
+            
+            nodes = material.node_tree.nodes
+            links = material.node_tree.links
+            bsdf = _get_node(nodes, "miktos_bsdf", 'ShaderNodeBsdfPrincipled')
+            output = _get_node(nodes, "miktos_output", 'ShaderNodeOutputMaterial')
+            links.new(bsdf.outputs[0], output.inputs["Surface"])
+            
+            # One image node per map type, reused when the map is applied again
+            tex_node = _get_node(nodes, f"miktos_{texture_type}", 'ShaderNodeTexImage')
+            tex_node.label = texture_type
+            tex_node.image = bpy.data.images.load(texture_path, check_existing=True)
+            if texture_type != "diffuse":
+                tex_node.image.colorspace_settings.name = 'Non-Color'
+            
+            if texture_type == "normal":
+                normal_map = _get_node(nodes, "miktos_normal_map", 'ShaderNodeNormalMap')
+                links.new(tex_node.outputs["Color"], normal_map.inputs["Color"])
+                links.new(normal_map.outputs["Normal"], bsdf.inputs["Normal"])
+            elif texture_type == "height":
+                displacement = _get_node(nodes, "miktos_displacement", 'ShaderNodeDisplacement')
+                links.new(tex_node.outputs["Color"], displacement.inputs["Height"])
+                links.new(displacement.outputs["Displacement"], output.inputs["Displacement"])
+            elif _MAP_INPUTS[texture_type]:
+                links.new(tex_node.outputs["Color"], bsdf.inputs[_MAP_INPUTS[texture_type]])
+            # The Principled BSDF has no AO input; that map stays on the material unlinked
+            
+            # Assign material to object
+            if obj.data.materials:
+                obj.data.materials[0] = material
+            else:
+                obj.data.materials.append(material)
+            
+            return {"status": "success", "message": f"{texture_type} texture applied to {object_name}"}
+            
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    
+    def start_server(self):
+        """Start WebSocket server"""
+        async def run_server():
+            self.server = await serve(
+                self.handle_command,
+                "localhost",
+                self.port,
+                write_limit=2**20,
+                max_size=2**23,
+                compression=None
+            )
+            # The bridge waits for this line before connecting
+            print("MIKTOS_READY", flush=True)
+            await self.server.wait_closed()
+        
+        def run_in_thread():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(run_server())
+        
+        thread = threading.Thread(target=run_in_thread)
+        thread.daemon = True
+        thread.start()
+
+# Initialize bridge when addon loads
+if __name__ == "__main__":
+    bridge = MiktosBridge()
+    bridge.start_server()
+    print("Miktos Bridge addon loaded and server started on port 9999")
@@ -2,11 +2,11 @@
 Base Connector Interface
 
 This module defines the base interface that all external software connectors
-must implement for consistent integration with the Miktos AI Bridge.
+must implement for consistent integration with the Miktos AI Bridge, plus a
+mixin carrying the shared connector state and helpers.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Protocol, runtime_checkable
 from enum import Enum
 import asyncio
 import logging
@@ -22,52 +22,71 @@ class ConnectorStatus(Enum):
     ERROR = "error"
 
 
-class BaseConnector(ABC):
-    """Base connector interface for external software integration"""
+@runtime_checkable
+class BaseConnector(Protocol):
+    """Base connector interface for external software integration
+
+    Connectors conform structurally and do not inherit from it, so
+    instantiating them involves no ABCMeta machinery.
+    """
+    
+    name: str
+    status: ConnectorStatus
+    last_error: Optional[str]
+    connection_params: Dict[str, Any]
     
-    def __init__(self, name: str):
-        self.name = name
-        self.status = ConnectorStatus.DISCONNECTED
-        self.last_error: Optional[str] = None
-        self.connection_params: Dict[str, Any] = {}
-        
-    @abstractmethod
     async def connect(self, **kwargs) -> bool:
         """Establish connection to external software"""
-        pass
+        ...
     
-    @abstractmethod
     async def disconnect(self) -> bool:
         """Disconnect from external software"""
-        pass
+        ...
     
-    @abstractmethod
     async def is_connected(self) -> bool:
         """Check if connection is active"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_scene_info(self) -> Dict[str, Any]:
         """Get current scene information"""
-        pass
+        ...
     
-    @abstractmethod
     async def apply_texture(self, object_name: str, texture_path: str, **kwargs) -> bool:
         """Apply texture to specified object"""
-        pass
+        ...
     
-    @abstractmethod
     async def execute_script(self, script: str) -> Dict[str, Any]:
         """Execute script in external software"""
-        pass
+        ...
+
+
+class ConnectorMixin:
+    """Common state and utility methods shared by connector implementations"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.status = ConnectorStatus.DISCONNECTED
+        self.last_error: Optional[str] = None
+        self.connection_params: Dict[str, Any] = {}
+    
+    @property
+    def status(self) -> ConnectorStatus:
+        """Current connector status"""
+        return self._status
+    
+    @status.setter
+    def status(self, value: ConnectorStatus):
+        # Keep the plain string alongside the enum so get_status skips .value
+        self._status = value
+        self._status_str = value.value
     
     # Common utility methods
     def get_status(self) -> Dict[str, Any]:
         """Get connector status"""
         return {
             "name": self.name,
-            "status": self.status.value,
-            "connected": self.status == ConnectorStatus.CONNECTED,
+            "status": self._status_str,
+            "connected": self._status_str == "connected",
             "last_error": self.last_error
         }
     
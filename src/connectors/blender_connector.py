@@ -7,23 +7,54 @@ and workflow automation.
 """
 
 import asyncio
-import json
+import functools
+import itertools
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import random
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from pathlib import Path
+import shutil
 import socket
+import msgspec
+import orjson
 import websockets
 from websockets.server import serve
-import subprocess
 import time
 
-from .base import BaseConnector, ConnectorStatus
-from ..core.config import settings
+from .base import BaseConnector, ConnectorMixin, ConnectorStatus
+from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# MessagePack ext type for raw buffers (numpy arrays etc.) in command payloads
+_EXT_BUFFER = 0x10
 
-class BlenderConnector(BaseConnector):
+
+def _enc_hook(obj: Any) -> msgspec.msgpack.Ext:
+    """Encode buffer-protocol objects msgspec doesn't know as raw-buffer ext"""
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        raise NotImplementedError(f"Cannot encode {type(obj).__name__}") from None
+    return msgspec.msgpack.Ext(_EXT_BUFFER, view.cast("B") if view.c_contiguous else view.tobytes())
+
+
+# MessagePack codec for the Blender WebSocket protocol (negotiated on connect)
+_ENC = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+_DEC = msgspec.msgpack.Decoder()
+
+# Blender addon source installed by _create_basic_addon
+_ADDON_TEMPLATE = Path(__file__).parent / "_miktos_bridge_template.py"
+
+# Line the addon prints once its WebSocket server is listening
+_READY_SENTINEL = b"MIKTOS_READY"
+
+# Failures _send_command can raise: no/closed connection or no reply in time
+_COMMUNICATION_ERRORS = (ConnectionError, asyncio.TimeoutError)
+
+
+class BlenderConnector(ConnectorMixin):
     """Connector for Blender integration via WebSocket communication"""
     
     def __init__(self, port: int = 9999):
@@ -31,12 +62,28 @@ class BlenderConnector(BaseConnector):
         self.port = port
         self.websocket = None
         self.server = None
-        self.blender_process = None
+        self.blender_process: Optional[asyncio.subprocess.Process] = None
+        self._output_task: Optional[asyncio.Task] = None
+        self._blender_path: Optional[str] = None  # Resolved on first launch
         self.addon_installed = False
         
         # Communication settings
         self.connection_timeout = 30
         self.command_timeout = 10
+        # Wire format; switched to "msgpack" if the addon agrees on connect
+        self.codec = "json"
+        
+        # Outbound command queue drained by a single writer task; responses
+        # are matched to waiting requests by msg_id in the reader task
+        self.max_batch_size = 64
+        self._send_q: Optional[asyncio.Queue] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._msg_counter = itertools.count()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._send_buf = bytearray()  # Reused msgpack encode buffer (writer task only)
+        self._reader_task: Optional[asyncio.Task] = None
+        self._echoes_msg_id = False  # Set once the addon echoes a msg_id back
         
     async def connect(self, **kwargs) -> bool:
         """Establish connection to Blender"""
@@ -44,21 +91,26 @@ class BlenderConnector(BaseConnector):
             self.status = ConnectorStatus.CONNECTING
             logger.info(f"Connecting to Blender on port {self.port}...")
             
-            # Check if Blender is already running with our addon
-            if not await self._check_blender_connection():
+            # Reuse Blender if it is already running with our addon
+            websocket = await self._try_connect()
+            if websocket:
+                await self._open_session(websocket)
+            else:
                 # Try to start Blender with our addon
                 if not await self._start_blender_with_addon():
+                    await self._stop_blender()
                     self.set_error("Failed to start Blender with Miktos addon")
                     return False
+                
+                # Wait for WebSocket connection
+                if not await self._wait_for_connection():
+                    await self._stop_blender()
+                    self.set_error("Connection timeout - Blender not responding")
+                    return False
             
-            # Wait for WebSocket connection
-            if await self._wait_for_connection():
-                self.status = ConnectorStatus.CONNECTED
-                logger.info("Successfully connected to Blender")
-                return True
-            else:
-                self.set_error("Connection timeout - Blender not responding")
-                return False
+            self.status = ConnectorStatus.CONNECTED
+            logger.info("Successfully connected to Blender")
+            return True
                 
         except Exception as e:
             self.set_error(f"Connection failed: {str(e)}")
@@ -67,6 +119,8 @@ class BlenderConnector(BaseConnector):
     async def disconnect(self) -> bool:
         """Disconnect from Blender"""
         try:
+            await self._stop_io_tasks()
+            
             if self.websocket:
                 await self.websocket.close()
                 self.websocket = None
@@ -76,6 +130,8 @@ class BlenderConnector(BaseConnector):
                 await self.server.wait_closed()
                 self.server = None
             
+            await self._stop_blender()
+            
             self.status = ConnectorStatus.DISCONNECTED
             logger.info("Disconnected from Blender")
             return True
@@ -89,16 +145,17 @@ class BlenderConnector(BaseConnector):
         if self.status != ConnectorStatus.CONNECTED or not self.websocket:
             return False
         
+        # Send ping to check connection
         try:
-            # Send ping to check connection
             response = await self._send_command({
                 "command": "ping",
                 "data": {}
             })
-            return response.get("status") == "success"
-        except:
+        except _COMMUNICATION_ERRORS:
             self.status = ConnectorStatus.DISCONNECTED
             return False
+        
+        return response.get("status") == "success"
     
     async def get_scene_info(self) -> Dict[str, Any]:
         """Get current scene information from Blender"""
@@ -107,56 +164,83 @@ class BlenderConnector(BaseConnector):
                 "command": "get_scene_info",
                 "data": {}
             })
-            
-            if response.get("status") == "success":
-                return response.get("data", {})
-            else:
-                raise Exception(f"Failed to get scene info: {response.get('error')}")
-                
-        except Exception as e:
+        except _COMMUNICATION_ERRORS as e:
             logger.error(f"Error getting scene info: {e}")
             return {}
+        
+        if response.get("status") == "success":
+            return response.get("data", {})
+        
+        logger.error(f"Failed to get scene info: {response.get('error')}")
+        return {}
     
     async def apply_texture(self, object_name: str, texture_path: str, **kwargs) -> bool:
         """Apply texture to specified object in Blender"""
+        command_data = {
+            "command": "apply_texture",
+            "data": {
+                "object_name": object_name,
+                "texture_path": str(texture_path),
+                "material_name": kwargs.get("material_name", f"{object_name}_material"),
+                "texture_type": kwargs.get("texture_type", "diffuse"),
+                "uv_unwrap": kwargs.get("uv_unwrap", True)
+            }
+        }
+        
         try:
-            command_data = {
+            response = await self._send_command(command_data)
+        except _COMMUNICATION_ERRORS as e:
+            logger.error(f"Error applying texture: {e}")
+            return False
+        
+        if response.get("status") == "success":
+            logger.info(f"Successfully applied texture to {object_name}")
+            return True
+        else:
+            logger.error(f"Failed to apply texture: {response.get('error')}")
+            return False
+    
+    async def apply_textures(self, object_name: str, texture_paths: Dict[str, str], **kwargs) -> Dict[str, bool]:
+        """Apply several texture maps to an object, sending all commands concurrently"""
+        map_types = list(texture_paths)
+        commands = [
+            {
                 "command": "apply_texture",
                 "data": {
                     "object_name": object_name,
-                    "texture_path": str(texture_path),
+                    "texture_path": str(texture_paths[map_type]),
                     "material_name": kwargs.get("material_name", f"{object_name}_material"),
-                    "texture_type": kwargs.get("texture_type", "diffuse"),
+                    "texture_type": map_type,
                     "uv_unwrap": kwargs.get("uv_unwrap", True)
                 }
             }
-            
-            response = await self._send_command(command_data)
-            
-            if response.get("status") == "success":
-                logger.info(f"Successfully applied texture to {object_name}")
-                return True
-            else:
-                logger.error(f"Failed to apply texture: {response.get('error')}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error applying texture: {e}")
-            return False
+            for map_type in map_types
+        ]
+        
+        try:
+            responses = await self.send_many(commands)
+        except _COMMUNICATION_ERRORS as e:
+            logger.error(f"Error applying textures: {e}")
+            return {map_type: False for map_type in map_types}
+        
+        results = {}
+        for map_type, response in zip(map_types, responses):
+            results[map_type] = response.get("status") == "success"
+            if not results[map_type]:
+                logger.error(f"Failed to apply {map_type} texture: {response.get('error')}")
+        
+        return results
     
     async def execute_script(self, script: str) -> Dict[str, Any]:
         """Execute Python script in Blender"""
         try:
-            response = await self._send_command({
+            return await self._send_command({
                 "command": "execute_script",
                 "data": {
                     "script": script
                 }
             })
-            
-            return response
-            
-        except Exception as e:
+        except _COMMUNICATION_ERRORS as e:
             logger.error(f"Error executing script: {e}")
             return {"status": "error", "error": str(e)}
     
@@ -173,12 +257,11 @@ class BlenderConnector(BaseConnector):
                     "name": kwargs.get("name")
                 }
             })
-            
-            return response.get("status") == "success"
-            
-        except Exception as e:
+        except _COMMUNICATION_ERRORS as e:
             logger.error(f"Error creating primitive: {e}")
             return False
+        
+        return response.get("status") == "success"
     
     async def get_selected_objects(self) -> List[str]:
         """Get list of currently selected objects"""
@@ -187,26 +270,31 @@ class BlenderConnector(BaseConnector):
                 "command": "get_selected_objects",
                 "data": {}
             })
-            
-            if response.get("status") == "success":
-                return response.get("data", {}).get("objects", [])
-            return []
-            
-        except Exception as e:
+        except _COMMUNICATION_ERRORS as e:
             logger.error(f"Error getting selected objects: {e}")
             return []
+        
+        if response.get("status") == "success":
+            return response.get("data", {}).get("objects", [])
+        return []
     
     # Private methods
-    async def _check_blender_connection(self) -> bool:
-        """Check if Blender is running and accessible"""
+    async def _try_connect(self):
+        """Open a WebSocket to the Blender addon, or return None if it isn't reachable"""
+        uri = f"ws://localhost:{self.port}"
         try:
-            # Try to connect to existing WebSocket
-            uri = f"ws://localhost:{self.port}"
-            websocket = await websockets.connect(uri, timeout=2)
-            await websocket.close()
-            return True
-        except:
-            return False
+            # Large write buffer so batched commands don't hit backpressure;
+            # RPC frames are too small to benefit from per-message deflate
+            return await websockets.connect(
+                uri,
+                open_timeout=2,
+                write_limit=2**20,
+                max_size=2**23,
+                compression=None
+            )
+        except (ConnectionRefusedError, asyncio.TimeoutError, OSError,
+                websockets.exceptions.InvalidHandshake):
+            return None
     
     async def _start_blender_with_addon(self) -> bool:
         """Start Blender with Miktos addon"""
@@ -218,211 +306,281 @@ class BlenderConnector(BaseConnector):
                 logger.error("Blender addon not found - creating basic addon")
                 await self._create_basic_addon(addon_path)
             
+            # Resolve the executable once: the configured path, else autodetect
+            if self._blender_path is None:
+                configured = get_settings().blender_path
+                self._blender_path = (configured if Path(configured).exists()
+                                      else get_blender_installation_path() or configured)
+            blender_path = self._blender_path
+            
             # Start Blender with addon
             blender_cmd = [
-                settings.blender_path,
+                blender_path,
                 "--background",
                 "--python", str(addon_path / "miktos_bridge.py")
             ]
             
-            logger.info(f"Starting Blender with Miktos addon: {settings.blender_path}")
-            self.blender_process = subprocess.Popen(
-                blender_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+            logger.info(f"Starting Blender with Miktos addon: {blender_path}")
+            self.blender_process = await asyncio.create_subprocess_exec(
+                *blender_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
             )
             
-            # Give Blender time to start
-            await asyncio.sleep(5)
+            # Wait for the addon to report its server is up rather than
+            # sleeping a fixed warm-up period
+            ready = asyncio.Event()
+            self._output_task = asyncio.create_task(self._watch_blender_output(ready))
+            ready_wait = asyncio.create_task(ready.wait())
+            await asyncio.wait(
+                {ready_wait, self._output_task},
+                timeout=self.connection_timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            ready_wait.cancel()
+            
+            if not ready.is_set():
+                if self._output_task.done():
+                    logger.error("Blender exited before the Miktos addon started")
+                    return False
+                # Older addons don't print the sentinel; let the connection poll decide
+                logger.warning("No ready signal from Blender addon - waiting for connection")
             return True
             
         except Exception as e:
             logger.error(f"Failed to start Blender: {e}")
             return False
     
+    async def _watch_blender_output(self, ready: asyncio.Event):
+        """Signal ready on the addon's sentinel line, draining output until Blender exits"""
+        async for line in self.blender_process.stdout:
+            if not ready.is_set() and _READY_SENTINEL in line:
+                ready.set()
+            logger.debug(f"Blender: {line.decode(errors='replace').rstrip()}")
+    
+    async def _stop_blender(self):
+        """Stop the output reader and the Blender process if this connector launched it"""
+        if self._output_task:
+            self._output_task.cancel()
+            try:
+                await self._output_task
+            except asyncio.CancelledError:
+                pass
+            self._output_task = None
+        
+        process, self.blender_process = self.blender_process, None
+        if process and process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("Blender did not exit after terminate - killing it")
+                process.kill()
+                await process.wait()
+    
     async def _wait_for_connection(self) -> bool:
         """Wait for Blender to establish WebSocket connection"""
-        start_time = time.time()
+        # Exponential backoff with jitter: retry quickly while Blender is
+        # starting, capped at one attempt per second
+        delay = 0.05
+        deadline = time.monotonic() + self.connection_timeout
         
-        while time.time() - start_time < self.connection_timeout:
-            try:
-                if await self._check_blender_connection():
-                    # Establish persistent connection
-                    uri = f"ws://localhost:{self.port}"
-                    self.websocket = await websockets.connect(uri)
-                    return True
-            except:
-                pass
+        while time.monotonic() < deadline:
+            # Keep the first successful connection as the persistent one
+            websocket = await self._try_connect()
+            if websocket:
+                await self._open_session(websocket)
+                return True
             
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 2, 1.0)
         
         return False
     
-    async def _send_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
-        """Send command to Blender via WebSocket"""
-        if not self.websocket:
-            raise Exception("No WebSocket connection to Blender")
-        
-        try:
-            # Send command
-            await self.websocket.send(json.dumps(command))
-            
-            # Wait for response
-            response_data = await asyncio.wait_for(
-                self.websocket.recv(),
-                timeout=self.command_timeout
-            )
-            
-            return json.loads(response_data)
-            
-        except asyncio.TimeoutError:
-            raise Exception("Command timeout - Blender not responding")
-        except Exception as e:
-            raise Exception(f"Communication error: {str(e)}")
+    async def _open_session(self, websocket):
+        """Adopt an open WebSocket as the persistent Blender connection"""
+        self.websocket = websocket
+        self._configure_socket()
+        self._start_io_tasks()
+        await self._negotiate_codec()
     
-    async def _create_basic_addon(self, addon_path: Path):
-        """Create basic Blender addon for Miktos integration"""
-        addon_path.mkdir(parents=True, exist_ok=True)
+    def _configure_socket(self):
+        """Set Nagle's algorithm on the Blender socket per blender_low_latency_mode"""
+        sock = self.websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
         
-        # Create basic addon file
-        addon_content = '''
-import bpy
-import bmesh
-import json
-import asyncio
-import websockets
-from websockets.server import serve
-import threading
-
-class MiktosBridge:
-    def __init__(self):
-        self.server = None
-        self.port = 9999
+        # Low latency: send each RPC immediately. Otherwise leave Nagle on and
+        # rely on the writer task's batched frames to fill segments.
+        nodelay = 1 if get_settings().blender_low_latency_mode else 0
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, nodelay)
+    
+    async def _negotiate_codec(self):
+        """Switch to MessagePack if the addon supports it; older addons stay on JSON"""
+        self.codec = "json"
+        try:
+            response = await self._send_command({"command": "hello", "codec": "msgpack"})
+        except _COMMUNICATION_ERRORS as e:
+            logger.warning(f"Codec negotiation failed, using JSON: {e}")
+            return
         
-    async def handle_command(self, websocket, path):
-        """Handle incoming commands from Miktos AI Bridge"""
-        async for message in websocket:
+        if response.get("codec") == "msgpack":
+            self.codec = "msgpack"
+        logger.info(f"Blender protocol codec: {self.codec}")
+    
+    def _decode(self, data) -> Dict[str, Any]:
+        """Decode a response frame, falling back to JSON"""
+        # msgspec decodes straight from any bytes-like frame without copying
+        if isinstance(data, (bytes, bytearray, memoryview)):
             try:
-                command = json.loads(message)
-                response = await self.process_command(command)
-                await websocket.send(json.dumps(response))
+                return _DEC.decode(data)
+            except msgspec.DecodeError:
+                pass
+        return orjson.loads(data)
+    
+    def _start_io_tasks(self):
+        """Start the writer/reader tasks for the current WebSocket"""
+        self._send_q = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(get_settings().blender_max_inflight)
+        self._echoes_msg_id = False
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._reader_task = asyncio.create_task(self._reader_loop())
+    
+    async def _stop_io_tasks(self):
+        """Stop the writer/reader tasks and fail outstanding requests"""
+        for task in (self._writer_task, self._reader_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._writer_task = None
+        self._reader_task = None
+        self._fail_pending(ConnectionError("Blender connection closed"))
+    
+    def _fail_pending(self, error: Exception, msg_ids: Optional[List[int]] = None):
+        """Fail waiting requests (all of them unless msg_ids is given)"""
+        for msg_id in list(self._pending if msg_ids is None else msg_ids):
+            future = self._pending.pop(msg_id, None)
+            if future and not future.done():
+                future.set_exception(error)
+    
+    async def _writer_loop(self):
+        """Send queued commands, coalescing whatever is already queued"""
+        while True:
+            batch = [await self._send_q.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._send_q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                if self.codec == "msgpack":
+                    # One frame per batch; a single command is sent bare
+                    _ENC.encode_into(batch if len(batch) > 1 else batch[0], self._send_buf)
+                    await self.websocket.send(self._send_buf)
+                else:
+                    # JSON must go out as text frames; binary frames mean msgpack
+                    for command in batch:
+                        await self.websocket.send(orjson.dumps(command).decode())
             except Exception as e:
-                error_response = {
-                    "status": "error",
-                    "error": str(e)
-                }
-                await websocket.send(json.dumps(error_response))
+                # Fail just this batch; the writer keeps serving the queue
+                self._fail_pending(
+                    ConnectionError(f"Communication error: {e}"),
+                    [command["msg_id"] for command in batch]
+                )
     
-    async def process_command(self, command):
-        """Process commands from AI Bridge"""
-        cmd_type = command.get("command")
-        data = command.get("data", {})
-        
-        if cmd_type == "ping":
-            return {"status": "success", "message": "pong"}
-        
-        elif cmd_type == "get_scene_info":
-            return self.get_scene_info()
-        
-        elif cmd_type == "apply_texture":
-            return self.apply_texture(data)
-        
-        elif cmd_type == "create_primitive":
-            return self.create_primitive(data)
+    async def _reader_loop(self):
+        """Resolve waiting requests as responses arrive"""
+        try:
+            async for frame in self.websocket:
+                # A bad frame must not kill the reader; its request times out
+                try:
+                    payload = self._decode(frame)
+                except Exception as e:
+                    logger.warning(f"Discarding undecodable Blender frame: {e}")
+                    continue
+                for response in payload if isinstance(payload, list) else [payload]:
+                    try:
+                        self._dispatch_response(response)
+                    except Exception as e:
+                        logger.warning(f"Discarding unreadable Blender response: {e}")
+            # Only reached when Blender closed the socket (not on disconnect)
+            self._mark_closed()
+        except websockets.exceptions.ConnectionClosed:
+            self._mark_closed()
+        finally:
+            self._fail_pending(ConnectionError("Blender connection closed"))
+    
+    def _mark_closed(self):
+        """Record that Blender went away so callers stop sending to it"""
+        if self.status == ConnectorStatus.CONNECTED:
+            self.status = ConnectorStatus.DISCONNECTED
+            logger.warning("Blender connection closed")
+    
+    def _dispatch_response(self, response: Dict[str, Any]):
+        """Hand a response to the request waiting for it"""
+        if not isinstance(response, dict):
+            raise ValueError(f"expected an object, got {type(response).__name__}")
         
+        msg_id = response.pop("msg_id", None)
+        if msg_id is not None:
+            self._echoes_msg_id = True
+        elif self._echoes_msg_id:
+            # The addon couldn't tell which request this answers; don't guess
+            logger.warning(f"Discarding Blender response without msg_id: {response}")
+            return
         else:
-            return {"status": "error", "error": f"Unknown command: {cmd_type}"}
-    
-    def get_scene_info(self):
-        """Get current scene information"""
-        scene = bpy.context.scene
-        objects = [obj.name for obj in scene.objects]
+            # Older addons don't echo msg_id but answer strictly in order
+            msg_id = next(iter(self._pending), None)
         
-        return {
-            "status": "success",
-            "data": {
-                "scene_name": scene.name,
-                "objects": objects,
-                "frame_current": scene.frame_current,
-                "frame_start": scene.frame_start,
-                "frame_end": scene.frame_end
-            }
-        }
+        future = self._pending.pop(msg_id, None)
+        if future and not future.done():
+            future.set_result(response)
     
-    def apply_texture(self, data):
-        """Apply texture to object"""
-        try:
-            object_name = data.get("object_name")
-            texture_path = data.get("texture_path")
-            
-            # Get object
-            obj = bpy.data.objects.get(object_name)
-            if not obj:
-                return {"status": "error", "error": f"Object {object_name} not found"}
-            
-            # Create material
-            material = bpy.data.materials.new(name=f"{object_name}_material")
-            material.use_nodes = True
-            
-            # Clear default nodes
-            material.node_tree.nodes.clear()
-            
-            # Add shader nodes
-            bsdf = material.node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-            output = material.node_tree.nodes.new(type='ShaderNodeOutputMaterial')
-            tex_node = material.node_tree.nodes.new(type='ShaderNodeTexImage')
-            
-            # Load texture
-            tex_node.image = bpy.data.images.load(texture_path)
-            
-            # Link nodes
-            material.node_tree.links.new(tex_node.outputs[0], bsdf.inputs[0])
-            material.node_tree.links.new(bsdf.outputs[0], output.inputs[0])
-            
-            # Assign material to object
-            if obj.data.materials:
-                obj.data.materials[0] = material
-            else:
-                obj.data.materials.append(material)
-            
-            return {"status": "success", "message": f"Texture applied to {object_name}"}
-            
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
+    async def send_many(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several commands at once and return their responses in order"""
+        return await asyncio.gather(*(self._send_command(command) for command in commands))
     
-    def start_server(self):
-        """Start WebSocket server"""
-        async def run_server():
-            self.server = await serve(self.handle_command, "localhost", self.port)
-            await self.server.wait_closed()
-        
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(run_server())
+    async def _send_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Send command to Blender via WebSocket"""
+        if not self.websocket or not self._send_q:
+            raise ConnectionError("No WebSocket connection to Blender")
         
-        thread = threading.Thread(target=run_in_thread)
-        thread.daemon = True
-        thread.start()
-
-# Initialize bridge when addon loads
-if __name__ == "__main__":
-    bridge = MiktosBridge()
-    bridge.start_server()
-    print("Miktos Bridge addon loaded and server started on port 9999")
-'''
+        async with self._inflight:
+            msg_id = next(self._msg_counter)
+            future = asyncio.get_running_loop().create_future()
+            self._pending[msg_id] = future
+            self._send_q.put_nowait({**command, "msg_id": msg_id})
+            
+            try:
+                return await asyncio.wait_for(future, timeout=self.command_timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError("Command timeout - Blender not responding") from None
+            finally:
+                self._pending.pop(msg_id, None)
+    
+    async def _create_basic_addon(self, addon_path: Path):
+        """Create basic Blender addon for Miktos integration"""
+        addon_path.mkdir(parents=True, exist_ok=True)
         
+        # Copy the addon source shipped alongside this module
         addon_file = addon_path / "miktos_bridge.py"
-        with open(addon_file, 'w') as f:
-            f.write(addon_content)
+        shutil.copyfile(_ADDON_TEMPLATE, addon_file)
         
         logger.info(f"Created basic Blender addon at {addon_file}")
 
 
 # Additional utility functions
-async def get_blender_installation_path():
-    """Detect Blender installation path"""
-    import shutil
+@functools.lru_cache(maxsize=1)
+def get_blender_installation_path() -> Optional[str]:
+    """Detect Blender installation path (resolved once per process)"""
+    # Explicit override
+    env_path = os.environ.get("BLENDER_PATH")
+    if env_path and Path(env_path).exists():
+        return env_path
     
     # Common Blender executable names
     blender_names = ["blender", "blender.exe", "Blender"]
@@ -458,3 +616,8 @@ async def get_blender_installation_path():
             return path
     
     return None
+
+
+if TYPE_CHECKING:
+    # Static check that BlenderConnector satisfies the connector protocol
+    _connector: BaseConnector = BlenderConnector()
@@ -7,22 +7,42 @@ ComfyUI integration, model management, and workflow execution.
 
 import asyncio
 import logging
+import sys
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 import json
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from .config import settings
+from .config import get_settings
 from .models import WorkflowStatus, AICommand, AIResponse, GenerationRequest
 from ..comfyui.client import ComfyUIClient
 from ..comfyui.workflow_manager import WorkflowManager
 from ..workflows.texture_generator import TextureGenerator
+from ..connectors.base import ConnectorStatus
 from ..connectors.blender_connector import BlenderConnector
 
 logger = logging.getLogger(__name__)
 
+def install_uvloop() -> bool:
+    """Install uvloop's event loop policy if enabled and available
+    
+    Must be called before the event loop is created (e.g. before asyncio.run).
+    """
+    if not get_settings().use_uvloop or sys.platform == "win32":
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 class BridgeStatus(Enum):
     """Bridge status enumeration"""
     INITIALIZING = "initializing"
@@ -42,6 +62,7 @@ class WorkflowExecution:
     end_time: Optional[datetime] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    start_time_iso: Optional[str] = None  # Formatted once for status payloads
 
 class MiktosAIBridge:
     """
@@ -55,9 +76,11 @@ class MiktosAIBridge:
         self.texture_generator: Optional[TextureGenerator] = None
         self.blender_connector: Optional[BlenderConnector] = None
         
-        # Execution tracking
-        self.active_workflows: Dict[str, WorkflowExecution] = {}
-        self.command_handlers: Dict[str, Callable] = {}
+        # Execution tracking: each workflow is kept as the plain dict that
+        # status queries return, and updated in place on state transitions.
+        # Insertion-ordered so the oldest finished workflows can be evicted.
+        self.active_workflows: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._running_count: int = 0
         
         # Callbacks
         self.progress_callbacks: List[Callable] = []
@@ -70,9 +93,11 @@ class MiktosAIBridge:
             logger.info("Initializing AI Bridge components...")
             
             # Initialize ComfyUI client
+            settings = get_settings()
+            host, port, timeout = settings.comfyui_host, settings.comfyui_port, settings.comfyui_timeout
             self.comfyui_client = ComfyUIClient(
-                server_address=f"{settings.comfyui_host}:{settings.comfyui_port}",
-                timeout=settings.comfyui_timeout
+                server_address=f"{host}:{port}",
+                timeout=timeout
             )
             
             # Initialize workflow manager
@@ -87,9 +112,6 @@ class MiktosAIBridge:
             # Initialize Blender connector
             self.blender_connector = BlenderConnector()
             
-            # Register command handlers
-            self._register_command_handlers()
-            
             # Test ComfyUI connection
             await self._test_comfyui_connection()
             
@@ -119,17 +141,6 @@ class MiktosAIBridge:
         
         logger.info("AI Bridge shutdown complete")
     
-    def _register_command_handlers(self):
-        """Register command handlers"""
-        self.command_handlers = {
-            "generate_texture": self._handle_generate_texture,
-            "generate_model": self._handle_generate_model,
-            "apply_style": self._handle_apply_style,
-            "execute_workflow": self._handle_execute_workflow,
-            "get_workflow_status": self._handle_get_workflow_status,
-            "cancel_workflow": self._handle_cancel_workflow,
-        }
-    
     async def _test_comfyui_connection(self):
         """Test ComfyUI connection"""
         if not self.comfyui_client:
@@ -151,7 +162,7 @@ class MiktosAIBridge:
                 error=f"Bridge not ready (status: {self.status.value})"
             )
         
-        handler = self.command_handlers.get(command.command)
+        handler = self._COMMAND_HANDLERS.get(command.command)
         if not handler:
             return AIResponse(
                 id=command.id,
@@ -161,7 +172,7 @@ class MiktosAIBridge:
         
         try:
             self.status = BridgeStatus.BUSY
-            result = await handler(command)
+            result = await handler(self, command)
             self.status = BridgeStatus.READY
             
             return AIResponse(
@@ -187,44 +198,71 @@ class MiktosAIBridge:
         prompt = command.parameters.get("prompt", "")
         size = command.parameters.get("size", [512, 512])
         maps = command.parameters.get("maps", ["diffuse", "normal", "roughness"])
+        object_name = command.parameters.get("object_name")
+        # Blender loads maps from loose files, so only bundle when not applying
+        bundle = bool(command.parameters.get("bundle")) and not object_name
         
         logger.info(f"Generating texture: {prompt}")
         
         # Create workflow execution
+        start_time = datetime.now()
         execution = WorkflowExecution(
             id=str(uuid.uuid4()),
             name=f"Texture: {prompt[:50]}",
             status=WorkflowStatus.RUNNING,
             progress=0.0,
-            start_time=datetime.now()
+            start_time=start_time,
+            start_time_iso=start_time.isoformat()
         )
         
-        self.active_workflows[execution.id] = execution
+        self._add_workflow(asdict(execution))
         
+        # Terminal status if the task ends without completing
+        end_status, error = WorkflowStatus.FAILED, None
         try:
             # Generate texture
             result = await self.texture_generator.generate_texture(
                 prompt=prompt,
                 size=size,
                 maps=maps,
-                progress_callback=lambda p: self._update_workflow_progress(execution.id, p)
+                progress_callback=lambda p: self._update_workflow_progress(execution.id, p),
+                bundle=bundle
             )
             
+            # Apply all generated maps to the target object in one round of
+            # concurrent Blender commands
+            applied = None
+            if (object_name and result.get("output_paths") and self.blender_connector
+                    and self.blender_connector.status == ConnectorStatus.CONNECTED):
+                applied = await self.blender_connector.apply_textures(object_name, result["output_paths"])
+            
             # Update execution
-            execution.status = WorkflowStatus.COMPLETED
-            execution.progress = 1.0
-            execution.end_time = datetime.now()
-            execution.result = result
+            self._set_status(
+                execution.id,
+                WorkflowStatus.COMPLETED,
+                progress=1.0,
+                end_time=datetime.now(),
+                result=result
+            )
             
-            return {
+            response = {
                 "workflow_id": execution.id,
                 "result": result
             }
+            if applied is not None:
+                response["applied_textures"] = applied
+            return response
             
+        except asyncio.CancelledError:
+            end_status = WorkflowStatus.CANCELLED
+            raise
         except Exception as e:
-            execution.status = WorkflowStatus.FAILED
-            execution.error = str(e)
+            error = str(e)
             raise
+        finally:
+            # However the task ended, the workflow must not stay RUNNING
+            if self.active_workflows.get(execution.id, {}).get("status") == WorkflowStatus.RUNNING:
+                self._set_status(execution.id, end_status, end_time=datetime.now(), error=error)
     
     async def _handle_generate_model(self, command: AICommand) -> Dict[str, Any]:
         """Handle 3D model generation command"""
@@ -260,7 +298,7 @@ class MiktosAIBridge:
         if not execution:
             raise Exception(f"Workflow {workflow_id} not found")
         
-        return asdict(execution)
+        return dict(execution)
     
     async def _handle_cancel_workflow(self, command: AICommand) -> Dict[str, Any]:
         """Handle workflow cancellation"""
@@ -272,21 +310,60 @@ class MiktosAIBridge:
         
         return {"message": f"Workflow {workflow_id} cancelled"}
     
+    # Command dispatch table, built once with the class: unbound handlers
+    # called as handler(self, command)
+    _COMMAND_HANDLERS: Dict[str, Callable] = {
+        "generate_texture": _handle_generate_texture,
+        "generate_model": _handle_generate_model,
+        "apply_style": _handle_apply_style,
+        "execute_workflow": _handle_execute_workflow,
+        "get_workflow_status": _handle_get_workflow_status,
+        "cancel_workflow": _handle_cancel_workflow,
+    }
+    
     async def cancel_workflow(self, workflow_id: str):
         """Cancel a workflow execution"""
         execution = self.active_workflows.get(workflow_id)
-        if execution and execution.status == WorkflowStatus.RUNNING:
-            execution.status = WorkflowStatus.CANCELLED
-            execution.end_time = datetime.now()
+        if execution and execution["status"] == WorkflowStatus.RUNNING:
+            self._set_status(workflow_id, WorkflowStatus.CANCELLED, end_time=datetime.now())
             
             # TODO: Cancel actual ComfyUI execution
             logger.info(f"Workflow {workflow_id} cancelled")
     
+    def _add_workflow(self, execution: Dict[str, Any]):
+        """Track a new workflow, evicting the oldest finished ones past the history limit"""
+        self.active_workflows[execution["id"]] = execution
+        if execution["status"] == WorkflowStatus.RUNNING:
+            self._running_count += 1
+        
+        excess = len(self.active_workflows) - get_settings().max_workflow_history
+        if excess > 0:
+            finished = []
+            for wid, w in self.active_workflows.items():
+                if w["status"] != WorkflowStatus.RUNNING:
+                    finished.append(wid)
+                    if len(finished) == excess:
+                        break
+            for wid in finished:
+                del self.active_workflows[wid]
+    
+    def _set_status(self, workflow_id: str, status: WorkflowStatus, **fields):
+        """Move a workflow to a new status, updating any other fields given"""
+        execution = self.active_workflows.get(workflow_id)
+        if execution:
+            if execution["status"] == WorkflowStatus.RUNNING and status != WorkflowStatus.RUNNING:
+                self._running_count -= 1
+            execution["status"] = status
+            execution.update(fields)
+    
     def _update_workflow_progress(self, workflow_id: str, progress: float):
         """Update workflow progress"""
         execution = self.active_workflows.get(workflow_id)
         if execution:
-            execution.progress = progress
+            # Coalesce tiny steps; completion is always reported
+            if abs(progress - execution["progress"]) < 0.005 and progress < 1.0:
+                return
+            execution["progress"] = progress
             
             # Notify progress callbacks
             for callback in self.progress_callbacks:
@@ -320,9 +397,9 @@ class MiktosAIBridge:
     
     def get_active_workflows_count(self) -> int:
         """Get number of active workflows"""
-        return len([w for w in self.active_workflows.values() 
-                   if w.status == WorkflowStatus.RUNNING])
+        return self._running_count
     
     def get_workflow_history(self) -> List[Dict[str, Any]]:
         """Get workflow execution history"""
-        return [asdict(w) for w in self.active_workflows.values()]
\ No newline at end of file
+        # Shallow copies: the records are already plain dicts
+        return [dict(w) for w in self.active_workflows.values()]
\ No newline at end of file
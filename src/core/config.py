@@ -2,6 +2,7 @@
 Configuration management for Miktos AI Bridge
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 
@@ -26,6 +27,7 @@ class Settings(BaseSettings):
     comfyui_output_path: str = "./output"
     comfyui_timeout: int = 300
     comfyui_standalone_mode: bool = True  # Run without external ComfyUI server
+    max_concurrent_maps: int = 4  # Texture maps generated in parallel per request
     
     # Database settings
     database_url: str = "sqlite:///./miktos.db"
@@ -44,6 +46,8 @@ class Settings(BaseSettings):
     # Blender settings
     blender_path: str = "/Applications/Blender.app/Contents/MacOS/Blender"
     blender_addon_port: int = 9999
+    blender_max_inflight: int = 32  # Concurrent commands per Blender connection
+    blender_low_latency_mode: bool = True  # TCP_NODELAY on; False lets Nagle coalesce batched writes
     
     # Output directories
     output_dir: str = "./output"
@@ -61,15 +65,24 @@ class Settings(BaseSettings):
     # Development settings
     auto_reload: bool = True
     
+    # Performance settings
+    use_uvloop: bool = True  # Use uvloop's event loop where available (not on Windows)
+    max_workflow_history: int = 1000  # Finished workflows kept for status/history queries
+    
     class Config:
         env_file = ".env"
         env_prefix = "MIKTOS_"
+        frozen = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, built on first call"""
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get the global settings instance"""
-    return settings
\ No newline at end of file
+def __getattr__(name: str):
+    """Expose get_settings() as the module attribute ``settings`` (PEP 562)"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,13 +6,22 @@ the AI Bridge for type safety and validation.
 """
 
 from enum import Enum
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Iterable
+from dataclasses import dataclass, field
+from array import array
 from datetime import datetime
+import sys
 import uuid
 
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
-class WorkflowStatus(Enum):
+
+# Slotted dataclasses where supported (Python 3.10+): no per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class WorkflowStatus(str, Enum):
     """Workflow execution status"""
     PENDING = "pending"
     RUNNING = "running"
@@ -21,7 +30,7 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class CommandType(Enum):
+class CommandType(str, Enum):
     """Available command types"""
     GENERATE_TEXTURE = "generate_texture"
     GENERATE_MODEL = "generate_model"
@@ -33,7 +42,7 @@ class CommandType(Enum):
     APPLY_TEXTURE = "apply_texture"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AICommand:
     """AI command data model"""
     id: str
@@ -54,7 +63,7 @@ class AICommand:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIResponse:
     """AI command response data model"""
     id: str
@@ -69,9 +78,10 @@ class AIResponse:
             self.timestamp = datetime.now()
 
 
-@dataclass
-class GenerationRequest:
+class GenerationRequest(BaseModel):
     """Base generation request model"""
+    model_config = ConfigDict(frozen=True, extra="forbid", protected_namespaces=())
+    
     prompt: str
     negative_prompt: str = ""
     width: int = 1024
@@ -82,19 +92,14 @@ class GenerationRequest:
     model_name: str = "stable-diffusion-xl"
 
 
-@dataclass
 class TextureGenerationRequest(GenerationRequest):
     """Texture generation specific request"""
-    maps: List[str] = None
+    maps: List[str] = Field(default_factory=lambda: ["diffuse", "normal", "roughness"])
     material_name: Optional[str] = None
     uv_unwrap: bool = True
-    
-    def __post_init__(self):
-        if self.maps is None:
-            self.maps = ["diffuse", "normal", "roughness"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowExecution:
     """Workflow execution tracking model"""
     id: str
@@ -108,11 +113,25 @@ class WorkflowExecution:
     workflow_data: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to a JSON-ready dictionary (payloads are shared, not copied)"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "result": self.result,
+            "error": self.error,
+            "workflow_data": self.workflow_data
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes"""
+        return orjson.dumps(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SceneInfo:
     """3D scene information model"""
     scene_name: str
@@ -129,7 +148,7 @@ class SceneInfo:
             self.timestamp = datetime.now()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TextureInfo:
     """Texture information model"""
     id: str
@@ -142,18 +161,72 @@ class TextureInfo:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class TextureTable:
+    """Column-oriented texture information, one row per texture"""
+    ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    file_paths: List[str] = field(default_factory=list)
+    widths: array = field(default_factory=lambda: array("I"))
+    heights: array = field(default_factory=lambda: array("I"))
+    formats: List[str] = field(default_factory=list)
+    map_types: List[str] = field(default_factory=list)
+    created_at: List[datetime] = field(default_factory=list)
+    metadata: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    
+    @classmethod
+    def from_textures(cls, textures: Iterable[TextureInfo]) -> "TextureTable":
+        """Build a table from individual texture records"""
+        table = cls()
+        for texture in textures:
+            table.append(texture)
+        return table
+    
+    def append(self, texture: TextureInfo):
+        """Add a texture as a new row"""
+        self.ids.append(texture.id)
+        self.names.append(texture.name)
+        self.file_paths.append(texture.file_path)
+        self.widths.append(texture.size[0])
+        self.heights.append(texture.size[1])
+        self.formats.append(texture.format)
+        self.map_types.append(texture.map_type)
+        self.created_at.append(texture.created_at)
+        self.metadata.append(texture.metadata)
+    
+    def index_of(self, map_type: str) -> int:
+        """Row index of the texture for a map type"""
+        return self.map_types.index(map_type)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __getitem__(self, index: int) -> TextureInfo:
+        """Reconstruct one row as a TextureInfo"""
+        return TextureInfo(
+            id=self.ids[index],
+            name=self.names[index],
+            file_path=self.file_paths[index],
+            size=[self.widths[index], self.heights[index]],
+            format=self.formats[index],
+            map_type=self.map_types[index],
+            created_at=self.created_at[index],
+            metadata=self.metadata[index]
+        )
+
+
+@dataclass(**_SLOTS)
 class MaterialInfo:
     """Material information model"""
     id: str
     name: str
-    textures: Dict[str, TextureInfo]
+    textures: TextureTable
     shader_type: str
     properties: Dict[str, Any]
     created_at: datetime
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectorStatus:
     """External connector status model"""
     name: str
@@ -168,7 +241,7 @@ class ConnectorStatus:
             self.capabilities = []
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemStatus:
     """System status model"""
     bridge_status: str
@@ -181,7 +254,7 @@ class SystemStatus:
     cpu_usage: Optional[float] = None
 
 
-class Priority(Enum):
+class Priority(str, Enum):
     """Task priority levels"""
     LOW = "low"
     NORMAL = "normal"
@@ -189,7 +262,7 @@ class Priority(Enum):
     URGENT = "urgent"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Task:
     """Background task model"""
     id: str
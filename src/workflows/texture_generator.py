@@ -6,29 +6,256 @@ workflows and various diffusion models.
 """
 
 import asyncio
+import io
 import logging
-from typing import Dict, Any, List, Optional, Callable
+import random
+import tarfile
+import time
+from typing import Dict, Any, List, Optional, Callable, Tuple, ClassVar, Set, Union
 from pathlib import Path
-import json
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 
+import numpy as np
+import orjson
+import websockets
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    _PIL_AVAILABLE = True
+except ImportError:
+    _PIL_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+from ..core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
+# Sampler seeds: independent per workflow, even when submitted concurrently
+_seed_rng = random.Random()
+
+# Placeholders at least this large fill their tiles with the Numba kernel;
+# below it the JIT warmup outweighs the NumPy path
+_NUMBA_MIN_PIXELS = 2048 * 2048
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _fill_tiles(out, cells, cell_size, square_size):
+        """Paint each cell's colour into the corner square of its cell, rows in parallel"""
+        height, width, channels = out.shape
+        for ci in prange(cells.shape[0]):
+            y0 = ci * cell_size
+            y1 = min(y0 + square_size, height)
+            for cj in range(cells.shape[1]):
+                x0 = cj * cell_size
+                x1 = min(x0 + square_size, width)
+                for y in range(y0, y1):
+                    for x in range(x0, x1):
+                        for c in range(channels):
+                            out[y, x, c] = cells[ci, cj, c]
+
+
+def _render_placeholder_png(job_id: str, map_type: str, size: List[int]) -> bytes:
+    """Render a placeholder texture as PNG bytes (blocking; run in an executor)"""
+    # Create image with appropriate colors for map type
+    if map_type == "normal":
+        color = (128, 128, 255)  # Normal map blue
+    elif map_type in ["roughness", "metallic", "height", "ambient_occlusion"]:
+        color = (128, 128, 128)  # Grayscale
+    else:
+        # Random color for diffuse
+        color = (
+            random.randint(100, 200),
+            random.randint(100, 200),
+            random.randint(100, 200)
+        )
+    
+    # Create image with some texture pattern: a noise-shifted 26px square
+    # in the corner of every 50px cell, built as a single array
+    width, height = size
+    base = np.array(color, dtype=np.int16)
+    noise = np.random.randint(-30, 31, ((height + 49) // 50, (width + 49) // 50, 1), dtype=np.int16)
+    cells = np.clip(base + noise, 0, 255).astype(np.uint8)
+    if _NUMBA_AVAILABLE and width * height >= _NUMBA_MIN_PIXELS:
+        pixels = np.empty((height, width, 3), dtype=np.uint8)
+        pixels[:] = base.astype(np.uint8)
+        _fill_tiles(pixels, cells, 50, 26)
+    else:
+        pattern = np.repeat(np.repeat(cells, 50, axis=0), 50, axis=1)[:height, :width]
+        in_square = (np.arange(height) % 50 <= 25)[:, None, None] & (np.arange(width) % 50 <= 25)[None, :, None]
+        pixels = np.where(in_square, pattern, base.astype(np.uint8))
+    img = Image.fromarray(pixels, 'RGB')
+    draw = ImageDraw.Draw(img)
+    
+    # Add text label
+    try:
+        font = ImageFont.load_default()
+        text = f"{map_type.upper()}\n{job_id[:8]}"
+        draw.text((10, 10), text, fill=(255, 255, 255))
+    except:
+        pass
+    
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _blocking_create_placeholder(job_id: str, map_type: str, size: List[int], output_dir: Path) -> str:
+    """Render and save a placeholder texture (blocking; run in an executor)"""
+    output_path = output_dir / f"{job_id}_{map_type}.png"
+    output_path.write_bytes(_render_placeholder_png(job_id, map_type, size))
+    
+    logger.info(f"Created placeholder texture: {output_path}")
+    return str(output_path)
+
+
+def _write_texture_set(bundle_path: Path, members: Dict[str, Union[bytes, str]]) -> None:
+    """Write a texture set to one tar archive (blocking; run in an executor)
+
+    Each member is either in-memory bytes or the path of a file to copy in.
+    """
+    mtime = int(time.time())
+    with tarfile.open(bundle_path, "w") as archive:
+        for name, content in members.items():
+            if isinstance(content, bytes):
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                info.mtime = mtime
+                archive.addfile(info, io.BytesIO(content))
+            else:
+                archive.add(content, arcname=name)
+
 
 class TextureGenerator:
     """AI-powered texture generation using ComfyUI workflows"""
     
+    # Completion events kept for prompts not yet registered by _wait_for_output
+    _MAX_EARLY_OUTPUTS = 256
+    
+    # Output directories already created by any instance in this process
+    _created_dirs: ClassVar[Set[Path]] = set()
+    
+    _AVAILABLE_MODELS: Tuple[str, ...] = (
+        "stable-diffusion-xl",
+        "stable-diffusion-v1-5",
+        "dreamshaper",
+        "realistic-vision"
+    )
+    
+    _SUPPORTED_MAPS: Tuple[str, ...] = (
+        "diffuse",
+        "normal",
+        "roughness",
+        "metallic",
+        "height",
+        "ambient_occlusion"
+    )
+    
+    # Prompt suffix per texture map type (diffuse uses the prompt unchanged)
+    _MAP_SUFFIXES = {
+        "diffuse": "",
+        "normal": ", normal map, surface details, purple and blue tones",
+        "roughness": ", roughness map, surface roughness, grayscale",
+        "metallic": ", metallic map, metal reflectance, grayscale",
+        "height": ", height map, displacement, grayscale",
+        "ambient_occlusion": ", ambient occlusion, shadow detail, grayscale"
+    }
+    
+    # Basic SDXL workflow; per-request inputs are filled in by _create_texture_workflow
+    _WORKFLOW_TEMPLATE = {
+        "1": {
+            "inputs": {
+                "text": "",
+                "clip": ["4", 1]
+            },
+            "class_type": "CLIPTextEncode"
+        },
+        "2": {
+            "inputs": {
+                "text": "",
+                "clip": ["4", 1]
+            },
+            "class_type": "CLIPTextEncode"
+        },
+        "3": {
+            "inputs": {
+                "seed": 0,
+                "steps": 20,
+                "cfg": 7.0,
+                "sampler_name": "euler",
+                "scheduler": "normal",
+                "denoise": 1.0,
+                "model": ["4", 0],
+                "positive": ["1", 0],
+                "negative": ["2", 0],
+                "latent_image": ["5", 0]
+            },
+            "class_type": "KSampler"
+        },
+        "4": {
+            "inputs": {
+                "ckpt_name": ""
+            },
+            "class_type": "CheckpointLoaderSimple"
+        },
+        "5": {
+            "inputs": {
+                "width": 1024,
+                "height": 1024,
+                "batch_size": 1
+            },
+            "class_type": "EmptyLatentImage"
+        },
+        "6": {
+            "inputs": {
+                "samples": ["3", 0],
+                "vae": ["4", 2]
+            },
+            "class_type": "VAEDecode"
+        },
+        "7": {
+            "inputs": {
+                "filename_prefix": "",
+                "images": ["6", 0]
+            },
+            "class_type": "SaveImage"
+        }
+    }
+    # Serialized once; decoding it yields a fresh, unshared copy per workflow
+    _WORKFLOW_TEMPLATE_JSON = orjson.dumps(_WORKFLOW_TEMPLATE)
+    
     def __init__(self, comfyui_client, workflow_manager):
         self.comfyui_client = comfyui_client
         self.workflow_manager = workflow_manager
         self.output_dir = Path("./output/textures")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Keyed on the absolute path: the relative one moves with the cwd
+        output_key = self.output_dir.resolve()
+        if output_key not in self._created_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_key)
         
         # Texture generation settings
         self.default_size = [1024, 1024]
         self.default_steps = 20
         self.default_cfg = 7.0
+        # Maps generated concurrently per texture; bounds load on the ComfyUI queue
+        self.max_concurrent_maps = get_settings().max_concurrent_maps
+        
+        # Prompts waiting on ComfyUI completion events, keyed by prompt_id.
+        # ComfyUI routes "executed" only to the submitter's socket, so the
+        # listener and every submission share one client id.
+        self._client_id = getattr(comfyui_client, "client_id", None) or str(uuid.uuid4())
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Outputs that arrived before their prompt was registered
+        self._early_outputs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._listener_task: Optional[asyncio.Task] = None
+        self._listener_ready: Optional[asyncio.Future] = None
         
     async def generate_texture(
         self,
@@ -39,9 +266,15 @@ class TextureGenerator:
         steps: int = None,
         cfg: float = None,
         model_name: str = "stable-diffusion-xl",
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        bundle: bool = False
     ) -> Dict[str, Any]:
-        """Generate texture maps using AI"""
+        """Generate texture maps using AI
+
+        With ``bundle``, placeholder maps stay in memory and the whole set
+        (maps plus metadata) is written once as ``<job_id>.tar``; output paths
+        are then member names within that archive.
+        """
         
         try:
             # Set defaults
@@ -57,29 +290,50 @@ class TextureGenerator:
             job_id = str(uuid.uuid4())
             output_paths = {}
             
-            # Generate each requested texture map
-            for i, map_type in enumerate(maps):
+            # Generate the requested texture maps concurrently
+            semaphore = asyncio.Semaphore(self.max_concurrent_maps)
+            completed = 0
+            step = 0.8 / len(maps) if maps else 0  # Reserve 20% for post-processing
+            
+            async def generate_map(map_type: str) -> Dict[str, Any]:
+                nonlocal completed
+                async with semaphore:
+                    result = await self._generate_single_map(
+                        prompt=self._adjust_prompt_for_map(prompt, map_type),
+                        negative_prompt=negative_prompt,
+                        size=size,
+                        steps=steps,
+                        cfg=cfg,
+                        model_name=model_name,
+                        map_type=map_type,
+                        job_id=job_id,
+                        in_memory=bundle
+                    )
+                completed += 1
                 if progress_callback:
-                    progress = (i / len(maps)) * 0.8  # Reserve 20% for post-processing
-                    progress_callback(progress)
-                
-                # Adjust prompt for specific map types
-                adjusted_prompt = self._adjust_prompt_for_map(prompt, map_type)
-                
-                # Generate texture map
-                result = await self._generate_single_map(
-                    prompt=adjusted_prompt,
-                    negative_prompt=negative_prompt,
-                    size=size,
-                    steps=steps,
-                    cfg=cfg,
-                    model_name=model_name,
-                    map_type=map_type,
-                    job_id=job_id
-                )
-                
-                if result.get("success"):
-                    output_paths[map_type] = result["output_path"]
+                    progress_callback(completed * step)
+                return result
+            
+            if progress_callback:
+                progress_callback(0.0)
+            
+            results = await asyncio.gather(
+                *[generate_map(map_type) for map_type in maps],
+                return_exceptions=True
+            )
+            
+            members: Dict[str, Union[bytes, str]] = {}  # Bundle contents by archive name
+            for map_type, result in zip(maps, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to generate {map_type} map: {result}")
+                elif result.get("success"):
+                    if bundle:
+                        content = result.get("png") or result["output_path"]
+                        suffix = ".png" if isinstance(content, bytes) else Path(content).suffix
+                        output_paths[map_type] = f"{map_type}{suffix}"
+                        members[output_paths[map_type]] = content
+                    else:
+                        output_paths[map_type] = result["output_path"]
                 else:
                     logger.error(f"Failed to generate {map_type} map: {result.get('error')}")
             
@@ -101,10 +355,17 @@ class TextureGenerator:
                 "output_paths": output_paths
             }
             
-            # Save metadata
-            metadata_path = self.output_dir / f"{job_id}_metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Save metadata, alongside the maps in one archive when bundling
+            metadata_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+            if bundle:
+                members["metadata.json"] = metadata_json
+                saved_path = self.output_dir / f"{job_id}.tar"
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _write_texture_set, saved_path, members
+                )
+            else:
+                saved_path = self.output_dir / f"{job_id}_metadata.json"
+                saved_path.write_bytes(metadata_json)
             
             if progress_callback:
                 progress_callback(1.0)
@@ -116,7 +377,7 @@ class TextureGenerator:
                 "job_id": job_id,
                 "output_paths": output_paths,
                 "metadata": metadata,
-                "metadata_path": str(metadata_path)
+                "bundle_path" if bundle else "metadata_path": str(saved_path)
             }
             
         except Exception as e:
@@ -135,9 +396,14 @@ class TextureGenerator:
         cfg: float,
         model_name: str,
         map_type: str,
-        job_id: str
+        job_id: str,
+        in_memory: bool = False
     ) -> Dict[str, Any]:
-        """Generate a single texture map"""
+        """Generate a single texture map
+
+        With ``in_memory``, a placeholder map is returned as PNG bytes under
+        ``"png"`` instead of being written to disk.
+        """
         
         try:
             # Create workflow for texture generation
@@ -154,7 +420,9 @@ class TextureGenerator:
             
             # Submit workflow to ComfyUI
             if self.comfyui_client and await self.comfyui_client.check_connection():
-                result = await self.comfyui_client.queue_workflow(workflow)
+                # Listen before submitting so no completion event can be missed
+                await self._ensure_output_listener()
+                result = await self.comfyui_client.queue_workflow(workflow, client_id=self._client_id)
                 
                 if result.get("success"):
                     # Wait for completion and get output
@@ -170,6 +438,12 @@ class TextureGenerator:
             else:
                 # Fallback: Create placeholder texture
                 logger.warning("ComfyUI not available, creating placeholder texture")
+                if in_memory and _PIL_AVAILABLE:
+                    png = await asyncio.get_running_loop().run_in_executor(
+                        None, _render_placeholder_png, job_id, map_type, size
+                    )
+                    return {"success": True, "png": png, "placeholder": True}
+                
                 output_path = await self._create_placeholder_texture(job_id, map_type, size)
                 
                 return {
@@ -183,17 +457,7 @@ class TextureGenerator:
     
     def _adjust_prompt_for_map(self, base_prompt: str, map_type: str) -> str:
         """Adjust prompt based on texture map type"""
-        
-        adjustments = {
-            "diffuse": base_prompt,
-            "normal": f"{base_prompt}, normal map, surface details, purple and blue tones",
-            "roughness": f"{base_prompt}, roughness map, surface roughness, grayscale",
-            "metallic": f"{base_prompt}, metallic map, metal reflectance, grayscale",
-            "height": f"{base_prompt}, height map, displacement, grayscale",
-            "ambient_occlusion": f"{base_prompt}, ambient occlusion, shadow detail, grayscale"
-        }
-        
-        return adjustments.get(map_type, base_prompt)
+        return f"{base_prompt}{self._MAP_SUFFIXES.get(map_type, '')}"
     
     def _create_texture_workflow(
         self,
@@ -208,164 +472,112 @@ class TextureGenerator:
     ) -> Dict[str, Any]:
         """Create ComfyUI workflow for texture generation"""
         
-        # Basic SDXL workflow template
-        workflow = {
-            "1": {
-                "inputs": {
-                    "text": prompt,
-                    "clip": ["4", 1]
-                },
-                "class_type": "CLIPTextEncode"
-            },
-            "2": {
-                "inputs": {
-                    "text": negative_prompt,
-                    "clip": ["4", 1]
-                },
-                "class_type": "CLIPTextEncode"
-            },
-            "3": {
-                "inputs": {
-                    "seed": int(datetime.now().timestamp()),
-                    "steps": steps,
-                    "cfg": cfg,
-                    "sampler_name": "euler",
-                    "scheduler": "normal",
-                    "denoise": 1.0,
-                    "model": ["4", 0],
-                    "positive": ["1", 0],
-                    "negative": ["2", 0],
-                    "latent_image": ["5", 0]
-                },
-                "class_type": "KSampler"
-            },
-            "4": {
-                "inputs": {
-                    "ckpt_name": f"{model_name}.safetensors"
-                },
-                "class_type": "CheckpointLoaderSimple"
-            },
-            "5": {
-                "inputs": {
-                    "width": width,
-                    "height": height,
-                    "batch_size": 1
-                },
-                "class_type": "EmptyLatentImage"
-            },
-            "6": {
-                "inputs": {
-                    "samples": ["3", 0],
-                    "vae": ["4", 2]
-                },
-                "class_type": "VAEDecode"
-            },
-            "7": {
-                "inputs": {
-                    "filename_prefix": f"texture_{map_type}",
-                    "images": ["6", 0]
-                },
-                "class_type": "SaveImage"
-            }
-        }
-        
+        # Every node and link list is a new object, so callers may mutate the result
+        workflow = orjson.loads(self._WORKFLOW_TEMPLATE_JSON)
+        workflow["1"]["inputs"]["text"] = prompt
+        workflow["2"]["inputs"]["text"] = negative_prompt
+        workflow["3"]["inputs"].update(seed=_seed_rng.getrandbits(32), steps=steps, cfg=cfg)
+        workflow["4"]["inputs"]["ckpt_name"] = f"{model_name}.safetensors"
+        workflow["5"]["inputs"].update(width=width, height=height)
+        workflow["7"]["inputs"]["filename_prefix"] = f"texture_{map_type}"
         return workflow
     
     async def _wait_for_output(self, prompt_id: str, job_id: str, map_type: str) -> str:
-        """Wait for ComfyUI to complete and return output path"""
-        
-        # This is a simplified implementation
-        # In practice, you'd monitor ComfyUI's queue and wait for completion
+        """Wait for ComfyUI to report the prompt executed and return its output path"""
+        # Registered right after submission; an event that beat us here is buffered
+        future = asyncio.get_running_loop().create_future()
+        output = self._early_outputs.pop(prompt_id, None)
+        if output is not None:
+            future.set_result(output)
+        self._pending[prompt_id] = future
+        try:
+            output = await asyncio.wait_for(future, timeout=get_settings().comfyui_timeout)
+        finally:
+            self._pending.pop(prompt_id, None)
         
-        max_wait = 300  # 5 minutes
-        wait_time = 0
+        image = output["images"][0]
+        return str(Path(get_settings().comfyui_output_path) / image.get("subfolder", "") / image["filename"])
+    
+    async def _ensure_output_listener(self):
+        """Start the ComfyUI WebSocket listener if needed and wait until it is connected"""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_ready = asyncio.get_running_loop().create_future()
+            self._listener_task = asyncio.create_task(self._listen_for_outputs(self._listener_ready))
+        # Shielded: one cancelled waiter must not cancel the shared connect
+        await asyncio.shield(self._listener_ready)
+    
+    async def _listen_for_outputs(self, ready: asyncio.Future):
+        """Resolve pending prompts from ComfyUI's "executed" WebSocket events"""
+        settings = get_settings()
+        uri = f"ws://{settings.comfyui_host}:{settings.comfyui_port}/ws?clientId={self._client_id}"
         
-        while wait_time < max_wait:
-            # Check if output file exists
-            # ComfyUI typically saves to output folder
-            output_pattern = f"texture_{map_type}*.png"
-            
-            # For now, create a placeholder path
-            output_filename = f"{job_id}_{map_type}.png"
-            output_path = self.output_dir / output_filename
-            
-            # Simulate processing time
-            await asyncio.sleep(2)
-            
-            # Create placeholder file for demo
-            await self._create_placeholder_texture(job_id, map_type, self.default_size)
-            
-            return str(output_path)
+        try:
+            async with websockets.connect(uri) as websocket:
+                ready.set_result(None)
+                async for message in websocket:
+                    # Binary frames are preview images; events are JSON text
+                    if isinstance(message, bytes):
+                        continue
+                    event = orjson.loads(message)
+                    if event.get("type") != "executed":
+                        continue
+                    
+                    data = event.get("data", {})
+                    prompt_id, output = data.get("prompt_id"), data.get("output") or {}
+                    if not output.get("images"):
+                        continue
+                    
+                    future = self._pending.get(prompt_id)
+                    if future is None:
+                        self._early_outputs[prompt_id] = output
+                        if len(self._early_outputs) > self._MAX_EARLY_OUTPUTS:
+                            self._early_outputs.popitem(last=False)
+                    elif not future.done():
+                        future.set_result(output)
+        except Exception as e:
+            logger.error(f"ComfyUI event listener stopped: {e}")
+            if not ready.done():
+                ready.set_exception(ConnectionError(f"Cannot reach ComfyUI event stream: {e}"))
+        finally:
+            if not ready.done():
+                ready.set_exception(ConnectionError("ComfyUI event stream closed"))
+            self._early_outputs.clear()
+            # Nothing can complete the waiting prompts any more
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("ComfyUI event stream closed"))
     
     async def _create_placeholder_texture(self, job_id: str, map_type: str, size: List[int]) -> str:
         """Create placeholder texture for testing"""
+        if not _PIL_AVAILABLE:
+            logger.error("Pillow not installed - cannot create placeholder texture")
+            return str(self.output_dir / f"{job_id}_{map_type}.png")
         
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            import random
-            
-            # Create image with appropriate colors for map type
-            if map_type == "normal":
-                color = (128, 128, 255)  # Normal map blue
-            elif map_type in ["roughness", "metallic", "height", "ambient_occlusion"]:
-                color = (128, 128, 128)  # Grayscale
+        # Render and encode off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, _blocking_create_placeholder, job_id, map_type, size, self.output_dir
+        )
+    
+    def extract_texture_set(self, job_id: str) -> Dict[str, str]:
+        """Unpack a bundled texture set into loose files, returning map paths"""
+        target_dir = self.output_dir / job_id
+        with tarfile.open(self.output_dir / f"{job_id}.tar") as archive:
+            metadata = orjson.loads(archive.extractfile("metadata.json").read())
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(target_dir, filter="data")
             else:
-                # Random color for diffuse
-                color = (
-                    random.randint(100, 200),
-                    random.randint(100, 200),
-                    random.randint(100, 200)
-                )
-            
-            # Create image
-            img = Image.new('RGB', size, color)
-            draw = ImageDraw.Draw(img)
-            
-            # Add some texture pattern
-            for i in range(0, size[0], 50):
-                for j in range(0, size[1], 50):
-                    noise = random.randint(-30, 30)
-                    adjusted_color = tuple(max(0, min(255, c + noise)) for c in color)
-                    draw.rectangle([i, j, i+25, j+25], fill=adjusted_color)
-            
-            # Add text label
-            try:
-                font = ImageFont.load_default()
-                text = f"{map_type.upper()}\n{job_id[:8]}"
-                draw.text((10, 10), text, fill=(255, 255, 255))
-            except:
-                pass
-            
-            # Save image
-            output_filename = f"{job_id}_{map_type}.png"
-            output_path = self.output_dir / output_filename
-            img.save(output_path)
-            
-            logger.info(f"Created placeholder texture: {output_path}")
-            return str(output_path)
-            
-        except Exception as e:
-            logger.error(f"Failed to create placeholder texture: {e}")
-            # Return a simple path even if creation failed
-            output_filename = f"{job_id}_{map_type}.png"
-            return str(self.output_dir / output_filename)
+                archive.extractall(target_dir)
+        
+        return {
+            map_type: str(target_dir / member)
+            for map_type, member in metadata["output_paths"].items()
+        }
     
     def get_available_models(self) -> List[str]:
         """Get list of available texture generation models"""
-        return [
-            "stable-diffusion-xl",
-            "stable-diffusion-v1-5",
-            "dreamshaper",
-            "realistic-vision"
-        ]
+        return list(self._AVAILABLE_MODELS)
     
     def get_supported_map_types(self) -> List[str]:
         """Get list of supported texture map types"""
-        return [
-            "diffuse",
-            "normal", 
-            "roughness",
-            "metallic",
-            "height",
-            "ambient_occlusion"
-        ]
+        return list(self._SUPPORTED_MAPS)
@@ -14,11 +14,13 @@ fi
 export COMFYUI_STANDALONE_MODE=true
 export COMFYUI_URL="http://localhost:8188"
 export LOG_LEVEL="INFO"
+export MIKTOS_STANDALONE_DELAY="${MIKTOS_STANDALONE_DELAY:-2}"
 
 echo "✅ Environment configured:"
 echo "   - Standalone Mode: $COMFYUI_STANDALONE_MODE"
 echo "   - ComfyUI URL: $COMFYUI_URL"
 echo "   - Log Level: $LOG_LEVEL"
+echo "   - Simulated Delay: ${MIKTOS_STANDALONE_DELAY}s"
 
 echo ""
 echo "🔧 Starting server on http://localhost:8000..."
@@ -0,0 +1,33 @@
+"""
+Shared pytest setup for the Miktos AI Bridge tests
+"""
+import os
+import sys
+
+import pytest
+
+# Add the project root to the Python path once for the whole session
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """Standalone ComfyUI executor shared by all tests"""
+    from src.comfyui.standalone_executor import StandaloneComfyUIExecutor
+    return StandaloneComfyUIExecutor()
+
+
+@pytest.fixture(scope="session")
+def workflow_manager():
+    """Workflow manager shared by all tests"""
+    workflow_manager = pytest.importorskip("src.comfyui.workflow_manager")
+    return workflow_manager.WorkflowManager()
+
+
+@pytest.fixture
+def fresh_settings():
+    """Rebuild settings from the environment for this test and after it"""
+    from src.core.config import get_settings
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,188 @@
+"""
+Tests for the Blender WebSocket connector
+
+The connector talks to the real addon template's handle_command over a local
+WebSocket; only Blender's own modules are replaced, since bpy cannot be
+imported outside Blender.
+"""
+import asyncio
+import importlib.util
+import sys
+import types
+
+import numpy as np
+import pytest
+import pytest_asyncio
+import websockets
+
+from src.connectors.base import BaseConnector
+from src.connectors.blender_connector import BlenderConnector, _ADDON_TEMPLATE
+
+
+@pytest.fixture
+def addon(monkeypatch):
+    """The addon template module, loaded with placeholder bpy/bmesh modules"""
+    monkeypatch.setitem(sys.modules, "bpy", types.ModuleType("bpy"))
+    monkeypatch.setitem(sys.modules, "bmesh", types.ModuleType("bmesh"))
+    spec = importlib.util.spec_from_file_location("miktos_bridge_template", _ADDON_TEMPLATE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def addon_bridge(addon):
+    """Addon bridge with an extra "echo" command reporting what it received"""
+    
+    class EchoBridge(addon.MiktosBridge):
+        async def process_command(self, command):
+            if command.get("command") == "echo":
+                value = command["data"]["value"]
+                return {"status": "success", "value": value, "type": type(value).__name__}
+            return await super().process_command(command)
+    
+    return EchoBridge()
+
+
+@pytest_asyncio.fixture
+async def serve_addon():
+    """Start a WebSocket handler locally and return a connector attached to it"""
+    servers, connectors = [], []
+    
+    async def start(handler):
+        server = await websockets.serve(handler, "127.0.0.1", 0, compression=None)
+        servers.append(server)
+        connector = BlenderConnector(port=server.sockets[0].getsockname()[1])
+        connectors.append(connector)
+        assert await connector.connect()
+        return connector
+    
+    yield start
+    
+    for connector in connectors:
+        await connector.disconnect()
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+def _echo(value):
+    return {"command": "echo", "data": {"value": value}}
+
+
+def test_conforms_to_connector_protocol():
+    """BlenderConnector satisfies BaseConnector structurally, without ABCMeta"""
+    assert isinstance(BlenderConnector(), BaseConnector)
+    assert type(BlenderConnector) is type
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_get_their_own_responses(serve_addon, addon_bridge):
+    """Responses are matched to requests by msg_id, not arrival order"""
+    connector = await serve_addon(addon_bridge.handle_command)
+    
+    responses = await asyncio.gather(*(connector._send_command(_echo(i)) for i in range(50)))
+    
+    assert [response["value"] for response in responses] == list(range(50))
+    assert not connector._pending
+
+
+@pytest.mark.asyncio
+async def test_malformed_frames_do_not_stop_the_reader(serve_addon, addon_bridge):
+    """Undecodable frames and non-object responses are skipped"""
+    
+    async def noisy_handler(websocket, path=None):
+        send = websocket.send
+        
+        async def send_with_noise(message):
+            await send("not json{")
+            await send("[1, 2]")
+            await send(message)
+        
+        websocket.send = send_with_noise
+        await addon_bridge.handle_command(websocket, path)
+    
+    connector = await serve_addon(noisy_handler)
+    
+    assert (await connector._send_command(_echo("first")))["value"] == "first"
+    assert (await connector._send_command(_echo("second")))["value"] == "second"
+    assert connector.status.value == "connected"
+
+
+@pytest.mark.asyncio
+async def test_legacy_addon_is_answered_in_order(serve_addon, addon_bridge):
+    """An addon that doesn't echo msg_id is matched first-in, first-out"""
+    
+    class LegacyBridge(type(addon_bridge)):
+        async def process_command(self, command):
+            if command.get("command") == "hello":
+                return {"status": "error", "error": "Unknown command: hello"}
+            return await super().process_command(command)
+        
+        async def respond(self, command):
+            return await self.process_command(command)
+    
+    connector = await serve_addon(LegacyBridge().handle_command)
+    
+    responses = await asyncio.gather(*(connector._send_command(_echo(i)) for i in range(20)))
+    
+    assert [response["value"] for response in responses] == list(range(20))
+    assert not connector._echoes_msg_id
+
+
+@pytest.mark.asyncio
+async def test_batched_responses_come_back_in_order(serve_addon, addon_bridge):
+    """send_many coalesces queued commands into one frame and keeps their order"""
+    frames = []
+    
+    async def counting_handler(websocket, path=None):
+        recv = websocket.recv
+        
+        async def counting_recv():
+            message = await recv()
+            frames.append(message)
+            return message
+        
+        websocket.recv = counting_recv
+        await addon_bridge.handle_command(websocket, path)
+    
+    connector = await serve_addon(counting_handler)
+    frames.clear()  # Drop the codec handshake
+    
+    responses = await connector.send_many([_echo(i) for i in range(10)])
+    
+    assert [response["value"] for response in responses] == list(range(10))
+    assert len(frames) == 1
+
+
+@pytest.mark.asyncio
+async def test_buffers_survive_msgpack_round_trip(serve_addon, addon_bridge):
+    """bytes and buffer-protocol payloads reach the addon as bytes"""
+    connector = await serve_addon(addon_bridge.handle_command)
+    assert connector.codec == "msgpack"
+    
+    array = np.arange(16, dtype=np.float32)
+    for value, expected in [
+        (b"\x00\xffraw", b"\x00\xffraw"),
+        (array, array.tobytes()),
+        (array[::2], array[::2].tobytes()),  # Non-contiguous views are copied
+    ]:
+        response = await connector._send_command(_echo(value))
+        assert response["type"] == "bytes"
+        assert response["value"] == expected
+
+
+@pytest.mark.asyncio
+async def test_refused_hello_falls_back_to_json(serve_addon, addon_bridge):
+    """An addon that rejects "hello" is spoken to in JSON"""
+    
+    class NoHelloBridge(type(addon_bridge)):
+        async def process_command(self, command):
+            if command.get("command") == "hello":
+                return {"status": "error", "error": "Unknown command: hello"}
+            return await super().process_command(command)
+    
+    connector = await serve_addon(NoHelloBridge().handle_command)
+    
+    assert connector.codec == "json"
+    assert (await connector._send_command(_echo("text")))["value"] == "text"
@@ -0,0 +1,56 @@
+"""
+Tests for workflow bookkeeping in the AI Bridge
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+bridge_module = pytest.importorskip("src.core.bridge")
+
+from src.core.models import AICommand, WorkflowStatus
+
+
+class FakeTextureGenerator:
+    """Stands in for ComfyUI: succeeds, fails or hangs on request"""
+    
+    def __init__(self, mode):
+        self.mode = mode
+    
+    async def generate_texture(self, **kwargs):
+        if self.mode == "fail":
+            raise RuntimeError("generation failed")
+        if self.mode == "hang":
+            await asyncio.sleep(3600)
+        return {"output_paths": {}}
+
+
+def _command():
+    return AICommand(id="cmd", command="generate_texture", parameters={"prompt": "brick"}, timestamp=datetime.now())
+
+
+async def _run(bridge, mode):
+    bridge.texture_generator = FakeTextureGenerator(mode)
+    return await bridge._handle_generate_texture(_command())
+
+
+@pytest.mark.asyncio
+async def test_running_count_returns_to_zero():
+    """Completed, failed and cancelled workflows all stop counting as running"""
+    bridge = bridge_module.MiktosAIBridge()
+    
+    await _run(bridge, "ok")
+    with pytest.raises(RuntimeError):
+        await _run(bridge, "fail")
+    
+    task = asyncio.create_task(_run(bridge, "hang"))
+    await asyncio.sleep(0)
+    assert bridge.get_active_workflows_count() == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert bridge.get_active_workflows_count() == 0
+    assert [w["status"] for w in bridge.active_workflows.values()] == [
+        WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED
+    ]
@@ -0,0 +1,20 @@
+"""
+Verify the AI Bridge setup: core dependencies and configuration import
+"""
+
+
+def test_server_imports():
+    """FastAPI and Uvicorn are installed"""
+    import fastapi  # noqa: F401
+    import uvicorn  # noqa: F401
+
+
+def test_torch_import():
+    """PyTorch is installed"""
+    import torch  # noqa: F401
+
+
+def test_config_import():
+    """Settings load and are cached across calls"""
+    from src.core.config import get_settings
+    assert get_settings() is get_settings()
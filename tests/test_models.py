@@ -0,0 +1,30 @@
+"""
+Tests for the core data models
+"""
+from datetime import datetime
+
+from src.core.models import TextureInfo, TextureTable
+
+
+def _texture(map_type, size):
+    return TextureInfo(
+        id=f"tex-{map_type}",
+        name=f"brick_{map_type}",
+        file_path=f"/textures/brick_{map_type}.png",
+        size=size,
+        format="png",
+        map_type=map_type,
+        created_at=datetime(2024, 1, 1),
+        metadata={"seed": 42} if map_type == "diffuse" else None
+    )
+
+
+def test_texture_table_round_trip():
+    """Rows come back out of the table exactly as they went in"""
+    textures = [_texture("diffuse", [1024, 512]), _texture("normal", [256, 256])]
+    table = TextureTable.from_textures(textures)
+    
+    assert len(table) == 2
+    assert [table[i] for i in range(len(table))] == textures
+    assert table.index_of("normal") == 1
+    assert list(table.widths) == [1024, 256]
@@ -0,0 +1,55 @@
+"""
+Tests for standalone ComfyUI mode
+"""
+import pytest
+
+from src.core.config import get_settings
+
+
+def test_standalone_mode_enabled():
+    """Standalone mode is on by default"""
+    assert get_settings().comfyui_standalone_mode
+
+
+@pytest.mark.asyncio
+async def test_connection(executor):
+    """The standalone executor always reports connected"""
+    assert await executor.check_connection()
+
+
+@pytest.mark.asyncio
+async def test_queue_status(executor):
+    """Queue status has ComfyUI's shape"""
+    queue = await executor.get_queue_status()
+    assert "queue_running" in queue
+
+
+@pytest.mark.asyncio
+async def test_available_models(executor):
+    """Mock models are listed"""
+    assert await executor.get_available_models()
+
+
+def test_workflow_templates(workflow_manager):
+    """Workflow templates are registered with a name and type"""
+    templates = workflow_manager.list_workflows()
+    assert templates
+    for template in templates:
+        assert template.name
+        assert template.type.value
+
+
+@pytest.mark.asyncio
+async def test_workflow_execution(executor):
+    """A simple generation completes and echoes its parameters"""
+    result = await executor.execute_simple_generation(
+        prompt="A beautiful medieval texture for 3D modeling",
+        negative_prompt="blurry, low quality",
+        steps=20,
+        cfg=7.0,
+        width=512,
+        height=512
+    )
+    assert result["status"] == "completed"
+    assert result["parameters"] == {"steps": 20, "cfg": 7.0, "width": 512, "height": 512}
+    assert result["output_files"]
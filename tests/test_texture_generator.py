@@ -0,0 +1,46 @@
+"""
+Tests for texture set generation without a ComfyUI server
+"""
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from src.workflows.texture_generator import TextureGenerator
+
+
+@pytest.mark.asyncio
+async def test_bundle_and_extract(tmp_path, monkeypatch):
+    """A bundled set is one tar that extracts to the same maps"""
+    monkeypatch.chdir(tmp_path)
+    generator = TextureGenerator(None, None)
+    generator.output_dir = tmp_path
+    
+    result = await generator.generate_texture("brick wall", size=[64, 64], maps=["diffuse", "normal"], bundle=True)
+    
+    assert result["output_paths"] == {"diffuse": "diffuse.png", "normal": "normal.png"}
+    assert list(tmp_path.glob("*.png")) == []
+    with tarfile.open(result["bundle_path"]) as archive:
+        assert set(archive.getnames()) == {"diffuse.png", "normal.png", "metadata.json"}
+    
+    paths = generator.extract_texture_set(result["job_id"])
+    assert set(paths) == {"diffuse", "normal"}
+    for path in paths.values():
+        assert Path(path).read_bytes().startswith(b"\x89PNG")
+
+
+def test_settings_read_at_construction(fresh_settings, monkeypatch, tmp_path):
+    """Environment overrides apply once the settings cache is cleared"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MIKTOS_MAX_CONCURRENT_MAPS", "2")
+    assert TextureGenerator(None, None).max_concurrent_maps == 2
+
+
+def test_workflows_do_not_share_template_state():
+    """Mutating a built workflow leaves the template and later workflows intact"""
+    args = ("brick", "", 64, 64, 20, 7.0, "sdxl", "diffuse")
+    workflow = TextureGenerator._create_texture_workflow(TextureGenerator, *args)
+    workflow["6"]["inputs"]["vae"][1] = 99
+    
+    assert TextureGenerator._WORKFLOW_TEMPLATE["6"]["inputs"]["vae"] == ["4", 2]
+    assert TextureGenerator._create_texture_workflow(TextureGenerator, *args)["6"]["inputs"]["vae"] == ["4", 2]
@@ -0,0 +1,30 @@
+"""
+Validate the standalone ComfyUI implementation end to end
+"""
+import pytest
+
+
+def test_executor_initialization(executor):
+    """The executor creates its output directory"""
+    assert executor.output_dir.is_dir()
+
+
+def test_workflows_described(workflow_manager):
+    """Every loaded workflow has a description"""
+    for workflow in workflow_manager.list_workflows():
+        assert workflow.description
+
+
+@pytest.mark.asyncio
+async def test_simple_generation(executor):
+    """Generation completes for the given prompt"""
+    result = await executor.execute_simple_generation(
+        prompt="test texture",
+        negative_prompt="low quality",
+        steps=20,
+        cfg=7.0,
+        width=512,
+        height=512
+    )
+    assert result["status"] == "completed"
+    assert result["prompt"] == "test texture"